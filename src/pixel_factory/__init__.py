@@ -4,13 +4,17 @@ Pixel Factory - Automated pixel creature asset pack generator.
 
 __version__ = "0.1.0"
 
+from typing import TYPE_CHECKING, Any
+
 from pixel_factory.models import (
     AnimationType,
     CreatureMetadata,
     PackMetadata,
     ThemeConfig,
 )
-from pixel_factory.generator import PixelArtGenerator, PlaceholderGenerator
+
+if TYPE_CHECKING:
+    from pixel_factory.generator import PixelArtGenerator, PlaceholderGenerator
 
 __all__ = [
     "AnimationType",
@@ -20,3 +24,12 @@ __all__ = [
     "PixelArtGenerator",
     "PlaceholderGenerator",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the generator classes (and PIL) on first access."""
+    if name in ("PixelArtGenerator", "PlaceholderGenerator"):
+        from pixel_factory import generator
+
+        return getattr(generator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
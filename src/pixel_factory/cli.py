@@ -9,9 +9,7 @@ from typing import Optional
 
 import click
 
-from pixel_factory.config import get_config
 from pixel_factory.models import GenerationConfig
-from pixel_factory.pipeline import CreaturePackPipeline
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -75,6 +73,12 @@ def cli() -> None:
     default=None,
     help="Output directory (default: ./output)",
 )
+@click.option(
+    "--workers",
+    type=int,
+    default=1,
+    help="Number of worker processes (0 = one per CPU, default: 1)",
+)
 @click.option(
     "--no-archive",
     is_flag=True,
@@ -104,12 +108,16 @@ def generate(
     count: Optional[int],
     variants: Optional[int],
     output: Optional[Path],
+    workers: int,
     no_archive: bool,
     cleanup: bool,
     config: Optional[Path],
     verbose: bool,
 ) -> None:
     """Generate a pixel creature asset pack."""
+    from pixel_factory.config import get_config
+    from pixel_factory.pipeline import CreaturePackPipeline
+
     setup_logging(verbose)
     logger = logging.getLogger(__name__)
 
@@ -145,6 +153,7 @@ def generate(
             num_creatures=count,
             num_variants=variants,
             output_dir=Path(output),
+            num_workers=workers or None,
         )
 
         # Display configuration
@@ -207,6 +216,8 @@ def generate(
 )
 def list_themes(config: Optional[Path]) -> None:
     """List available themes."""
+    from pixel_factory.config import get_config
+
     app_config = get_config(config)
 
     click.echo("\nAvailable Themes:")
@@ -2,11 +2,12 @@
 Configuration management for Pixel Factory.
 """
 
+import copy
+import json
 import os
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Optional
-
-import yaml
+from typing import Any, Dict, Optional, Tuple
 
 from pixel_factory.models import ThemeConfig
 
@@ -16,37 +17,122 @@ DEFAULT_THEMES = {
         name="cute_forest",
         description="Adorable forest creatures",
         base_description="cute small forest animal creature",
-        mood_adjectives=["friendly", "cheerful", "playful", "curious", "happy"],
-        color_palette_hints=["green and brown", "orange and yellow", "blue and white", "pink and purple", "red and brown"],
+        mood_adjectives=("friendly", "cheerful", "playful", "curious", "happy"),
+        color_palette_hints=("green and brown", "orange and yellow", "blue and white", "pink and purple", "red and brown"),
         background_color="#2d5016",
     ),
     "dark_dungeon": ThemeConfig(
         name="dark_dungeon",
         description="Menacing dungeon monsters",
         base_description="dark dungeon monster creature",
-        mood_adjectives=["menacing", "sinister", "aggressive", "fierce", "intimidating"],
-        color_palette_hints=["dark purple and black", "red and black", "green and brown", "gray and dark blue", "brown and orange"],
+        mood_adjectives=("menacing", "sinister", "aggressive", "fierce", "intimidating"),
+        color_palette_hints=("dark purple and black", "red and black", "green and brown", "gray and dark blue", "brown and orange"),
         background_color="#1a0d1a",
     ),
     "robot_aliens": ThemeConfig(
         name="robot_aliens",
         description="Robotic alien beings",
         base_description="small robot alien creature",
-        mood_adjectives=["mechanical", "futuristic", "sleek", "advanced", "technological"],
-        color_palette_hints=["silver and blue", "gold and red", "green and black", "cyan and white", "purple and pink"],
+        mood_adjectives=("mechanical", "futuristic", "sleek", "advanced", "technological"),
+        color_palette_hints=("silver and blue", "gold and red", "green and black", "cyan and white", "purple and pink"),
         background_color="#0d1a26",
     ),
     "ocean_creatures": ThemeConfig(
         name="ocean_creatures",
         description="Aquatic sea creatures",
         base_description="small sea creature ocean animal",
-        mood_adjectives=["flowing", "graceful", "mysterious", "colorful", "peaceful"],
-        color_palette_hints=["blue and cyan", "orange and yellow", "purple and pink", "green and teal", "red and orange"],
+        mood_adjectives=("flowing", "graceful", "mysterious", "colorful", "peaceful"),
+        color_palette_hints=("blue and cyan", "orange and yellow", "purple and pink", "green and teal", "red and orange"),
         background_color="#0a2463",
     ),
 }
 
 
+# Parsed config files keyed by resolved path: (mtime, size, data)
+_YAML_CACHE: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+_YAML_CACHE_MAX = 100
+
+
+def _parse_config_file(config_file: Path, mtime: float, size: int) -> Dict[str, Any]:
+    """
+    Parse a YAML config file, preferring an up-to-date JSON sidecar.
+
+    The sidecar (``<name>.yaml.cache.json``) is written after each YAML parse
+    and records the YAML file's mtime and size. It is reused only while both
+    still match, so restoring an older file with its mtime preserved is
+    re-parsed too. Unreadable or malformed sidecars, and sidecar I/O errors
+    (e.g. read-only directories), fall back to parsing the YAML.
+
+    Args:
+        config_file: Path to YAML config file
+        mtime: Modification time of the YAML config file
+        size: Size in bytes of the YAML config file
+
+    Returns:
+        Parsed config data
+    """
+    cache_path = config_file.with_suffix(config_file.suffix + ".cache.json")
+
+    try:
+        cached = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        cached = None
+    if (
+        isinstance(cached, dict)
+        and cached.get("mtime") == mtime
+        and cached.get("size") == size
+        and isinstance(cached.get("data"), dict)
+    ):
+        data: Dict[str, Any] = cached["data"]
+        return data
+
+    # Imported here so commands that never read a config file skip the cost
+    import yaml
+
+    # CSafeLoader is only available when PyYAML is built against libyaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(config_file, "rb") as f:
+        data = yaml.load(f, Loader=loader) or {}
+
+    try:
+        cache_path.write_bytes(json.dumps({"mtime": mtime, "size": size, "data": data}).encode())
+    except (OSError, TypeError):
+        pass
+
+    return data
+
+
+def _read_config_data(config_file: Path) -> Dict[str, Any]:
+    """
+    Read and parse a YAML config file, reusing a cached parse when unchanged.
+
+    Cached entries are validated against the file's mtime and size, and a
+    deep copy is returned so callers can't mutate the cached data.
+
+    Args:
+        config_file: Path to YAML config file
+
+    Returns:
+        Parsed config data
+    """
+    st = config_file.stat()
+    key = str(config_file.resolve())
+
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime and cached[1] == st.st_size:
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(cached[2])
+
+    data = _parse_config_file(config_file, st.st_mtime, st.st_size)
+
+    _YAML_CACHE[key] = (st.st_mtime, st.st_size, data)
+    _YAML_CACHE.move_to_end(key)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+        _YAML_CACHE.popitem(last=False)
+
+    return copy.deepcopy(data)
+
+
 class Config:
     """Main configuration class for Pixel Factory."""
 
@@ -74,8 +160,7 @@ class Config:
         Args:
             config_file: Path to YAML config file
         """
-        with open(config_file, "r") as f:
-            data = yaml.safe_load(f)
+        data = _read_config_data(config_file)
 
         if "defaults" in data:
             defaults = data["defaults"]
@@ -91,8 +176,8 @@ class Config:
                     name=theme_name,
                     description=theme_data.get("description", ""),
                     base_description=theme_data["base_description"],
-                    mood_adjectives=theme_data["mood_adjectives"],
-                    color_palette_hints=theme_data["color_palette_hints"],
+                    mood_adjectives=tuple(theme_data["mood_adjectives"]),
+                    color_palette_hints=tuple(theme_data["color_palette_hints"]),
                     background_color=theme_data.get("background_color", "#1a1a1a"),
                 )
 
@@ -116,8 +201,19 @@ class Config:
         return self.themes[theme_name]
 
 
-# Global config instance
+# Global config instance and the (config_file, mtime) it was built from
 _config: Optional[Config] = None
+_config_key: Optional[Tuple[Optional[str], Optional[float]]] = None
+
+
+def _get_config_key(config_file: Optional[Path]) -> Tuple[Optional[str], Optional[float]]:
+    """Build the cache key identifying the config source for the global instance."""
+    if config_file is None:
+        return (None, None)
+    try:
+        return (str(config_file.resolve()), config_file.stat().st_mtime)
+    except OSError:
+        return (str(config_file), None)
 
 
 def get_config(config_file: Optional[Path] = None) -> Config:
@@ -130,7 +226,13 @@ def get_config(config_file: Optional[Path] = None) -> Config:
     Returns:
         Config instance
     """
-    global _config
+    global _config, _config_key
     if _config is None:
         _config = Config(config_file)
+        _config_key = _get_config_key(config_file)
+    elif config_file is not None:
+        key = _get_config_key(config_file)
+        if key != _config_key:
+            _config = Config(config_file)
+            _config_key = key
     return _config
@@ -2,13 +2,92 @@
 Image generation backends for pixel creatures.
 """
 
-import random
+import os
+import zlib
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Type
 
 from PIL import Image, ImageDraw
 
 from pixel_factory.models import AnimationType, ThemeConfig
+from pixel_factory.spritesheet import get_process_context, to_palette_image
+
+# A single frame to render: (creature_index, animation_type, frame_index)
+FrameJob = Tuple[int, AnimationType, int]
+
+RGBA = Tuple[int, int, int, int]
+# (primary_color, secondary_color, accent_color)
+CreatureColors = Tuple[RGBA, RGBA, RGBA]
+
+# Hex color schemes per theme: (primary, secondary, accent)
+_COLOR_SCHEMES: Mapping[str, Tuple[Tuple[str, str, str], ...]] = {
+    "cute_forest": (
+        ("#8bc34a", "#4caf50", "#cddc39"),
+        ("#ff9800", "#ff5722", "#ffc107"),
+        ("#2196f3", "#03a9f4", "#00bcd4"),
+        ("#e91e63", "#9c27b0", "#f06292"),
+        ("#795548", "#8d6e63", "#a1887f"),
+    ),
+    "dark_dungeon": (
+        ("#4a148c", "#6a1b9a", "#7b1fa2"),
+        ("#b71c1c", "#c62828", "#d32f2f"),
+        ("#1b5e20", "#2e7d32", "#388e3c"),
+        ("#263238", "#37474f", "#455a64"),
+        ("#e65100", "#ef6c00", "#f57c00"),
+    ),
+    "robot_aliens": (
+        ("#0277bd", "#0288d1", "#03a9f4"),
+        ("#f57f17", "#f9a825", "#fbc02d"),
+        ("#00695c", "#00796b", "#00897b"),
+        ("#4a148c", "#6a1b9a", "#7b1fa2"),
+        ("#c2185b", "#d81b60", "#e91e63"),
+    ),
+    "ocean_creatures": (
+        ("#01579b", "#0277bd", "#0288d1"),
+        ("#e65100", "#ef6c00", "#f57c00"),
+        ("#4a148c", "#6a1b9a", "#7b1fa2"),
+        ("#00695c", "#00796b", "#00897b"),
+        ("#c62828", "#d32f2f", "#e53935"),
+    ),
+}
+
+
+def _hex_to_rgba(hex_color: str) -> RGBA:
+    """Convert a ``#rrggbb`` color string to an opaque RGBA tuple."""
+    return (int(hex_color[1:3], 16), int(hex_color[3:5], 16), int(hex_color[5:7], 16), 255)
+
+
+# Color schemes parsed once so drawing never re-parses hex strings
+_COLOR_SCHEMES_RGBA: Mapping[str, Tuple[CreatureColors, ...]] = MappingProxyType(
+    {
+        theme_name: tuple(
+            (_hex_to_rgba(primary), _hex_to_rgba(secondary), _hex_to_rgba(accent))
+            for primary, secondary, accent in schemes
+        )
+        for theme_name, schemes in _COLOR_SCHEMES.items()
+    }
+)
+
+_SHAPES = ("blob", "quadruped", "biped", "flying", "serpent")
+
+# Indices into CreatureColors
+PRIMARY, SECONDARY, ACCENT = 0, 1, 2
+
+# A drawing primitive: (kind, coords, fill_index, outline_index). Coords are
+# (x0, y0, x1, y1) for "ellipse"/"rectangle" and point pairs for "polygon".
+Primitive = Tuple[str, Tuple, Optional[int], Optional[int]]
+
+
+@lru_cache(maxsize=1024)
+def _creature_colors(theme_name: str, creature_index: int) -> CreatureColors:
+    """Pick a creature's color scheme, memoized per (theme_name, creature_index)."""
+    theme_colors = _COLOR_SCHEMES_RGBA.get(theme_name, _COLOR_SCHEMES_RGBA["cute_forest"])
+    # CRC32 is stable across processes, unlike the salted built-in str hash
+    index = (zlib.crc32(theme_name.encode()) + creature_index) % len(theme_colors)
+    return theme_colors[index]
 
 
 class PixelArtGenerator(ABC):
@@ -69,6 +148,71 @@ class PixelArtGenerator(ABC):
             for i in range(num_frames)
         ]
 
+    def generate_batch(
+        self,
+        theme: ThemeConfig,
+        jobs: Sequence[FrameJob],
+        max_workers: Optional[int] = None,
+    ) -> List[Image.Image]:
+        """
+        Generate many frames, spreading the work across processes.
+
+        Each worker builds its own generator from ``type(self)(self.resolution)``,
+        so subclasses that need extra constructor arguments should override this.
+
+        Args:
+            theme: Theme configuration
+            jobs: Frames to render as (creature_index, animation_type, frame_index)
+            max_workers: Number of worker processes (default: CPU count, 1 = in-process)
+
+        Returns:
+            List of PIL Images in the same order as ``jobs``
+        """
+        workers = max_workers or os.cpu_count() or 1
+        if workers <= 1 or len(jobs) <= 1:
+            return [self.generate_single_creature(theme, *job) for job in jobs]
+
+        # Split into a few chunks per worker to balance load without per-frame IPC
+        num_chunks = min(len(jobs), workers * 4)
+        chunk_size = -(-len(jobs) // num_chunks)
+        chunks = [list(jobs[i : i + chunk_size]) for i in range(0, len(jobs), chunk_size)]
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_process_context()) as executor:
+            results = executor.map(
+                _generate_batch_worker,
+                [type(self)] * len(chunks),
+                [self.resolution] * len(chunks),
+                [theme] * len(chunks),
+                chunks,
+            )
+            return [frame for chunk in results for frame in chunk]
+
+    def finalize(self, image: Image.Image) -> Image.Image:
+        """
+        Convert a finished frame into its most compact form for saving.
+
+        Delegates to spritesheet.to_palette_image. The save functions already
+        apply it, so this is only needed for images saved some other way.
+
+        Args:
+            image: Finished RGBA image
+
+        Returns:
+            Palette image, or the original image if it can't be palettized exactly
+        """
+        return to_palette_image(image)
+
+
+def _generate_batch_worker(
+    generator_cls: Type[PixelArtGenerator],
+    resolution: Tuple[int, int],
+    theme: ThemeConfig,
+    jobs: List[FrameJob],
+) -> List[Image.Image]:
+    """Render a chunk of frame jobs in a worker process."""
+    generator = generator_cls(resolution)
+    return [generator.generate_single_creature(theme, *job) for job in jobs]
+
 
 class PlaceholderGenerator(PixelArtGenerator):
     """
@@ -78,6 +222,13 @@ class PlaceholderGenerator(PixelArtGenerator):
     simple but distinct pixel art creatures using basic shapes.
     """
 
+    # Vertical pixel offset per frame for each animation type
+    _ANIMATION_OFFSETS: Dict[AnimationType, Tuple[int, ...]] = {
+        AnimationType.IDLE: (0, 1),  # Gentle bobbing
+        AnimationType.WALK: (0, 1, 0, -1),  # Up and down motion
+        AnimationType.ATTACK: (0, 2, 1, 0),  # Forward thrust
+    }
+
     def __init__(self, resolution: Tuple[int, int]) -> None:
         """
         Initialize placeholder generator.
@@ -86,10 +237,31 @@ class PlaceholderGenerator(PixelArtGenerator):
             resolution: Target resolution for generated images
         """
         super().__init__(resolution)
-        # Seed based on resolution for reproducibility
-        self._rng = random.Random(resolution[0] * 1000 + resolution[1])
-
-    def _get_creature_colors(self, theme: ThemeConfig, creature_index: int) -> Tuple[str, str, str]:
+        # Shape primitives resolved once for this resolution
+        self._layout = self._build_layout(*resolution)
+        self._init_render_state()
+
+    def _init_render_state(self) -> None:
+        """Create the scratch canvas and pose cache (not pickled)."""
+        # Scratch canvas and its drawing context, reused for every pose
+        self._canvas = Image.new("RGBA", self.resolution, (0, 0, 0, 0))
+        self._draw = ImageDraw.Draw(self._canvas)
+        # Rendered frames keyed by pose: (shape, colors, offset)
+        self._pose_cache: Dict[Tuple[str, CreatureColors, int], Image.Image] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop the drawing context and caches so the generator can be sent to workers."""
+        state = self.__dict__.copy()
+        for key in ("_canvas", "_draw", "_pose_cache"):
+            state.pop(key, None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pickled generator with fresh render state."""
+        self.__dict__.update(state)
+        self._init_render_state()
+
+    def _get_creature_colors(self, theme: ThemeConfig, creature_index: int) -> CreatureColors:
         """
         Generate consistent colors for a creature.
 
@@ -98,44 +270,9 @@ class PlaceholderGenerator(PixelArtGenerator):
             creature_index: Index of the creature
 
         Returns:
-            Tuple of (primary_color, secondary_color, accent_color)
+            Tuple of RGBA (primary_color, secondary_color, accent_color)
         """
-        # Deterministic random based on theme and creature index
-        rng = random.Random(hash(theme.name) + creature_index)
-
-        color_schemes = {
-            "cute_forest": [
-                ("#8bc34a", "#4caf50", "#cddc39"),
-                ("#ff9800", "#ff5722", "#ffc107"),
-                ("#2196f3", "#03a9f4", "#00bcd4"),
-                ("#e91e63", "#9c27b0", "#f06292"),
-                ("#795548", "#8d6e63", "#a1887f"),
-            ],
-            "dark_dungeon": [
-                ("#4a148c", "#6a1b9a", "#7b1fa2"),
-                ("#b71c1c", "#c62828", "#d32f2f"),
-                ("#1b5e20", "#2e7d32", "#388e3c"),
-                ("#263238", "#37474f", "#455a64"),
-                ("#e65100", "#ef6c00", "#f57c00"),
-            ],
-            "robot_aliens": [
-                ("#0277bd", "#0288d1", "#03a9f4"),
-                ("#f57f17", "#f9a825", "#fbc02d"),
-                ("#00695c", "#00796b", "#00897b"),
-                ("#4a148c", "#6a1b9a", "#7b1fa2"),
-                ("#c2185b", "#d81b60", "#e91e63"),
-            ],
-            "ocean_creatures": [
-                ("#01579b", "#0277bd", "#0288d1"),
-                ("#e65100", "#ef6c00", "#f57c00"),
-                ("#4a148c", "#6a1b9a", "#7b1fa2"),
-                ("#00695c", "#00796b", "#00897b"),
-                ("#c62828", "#d32f2f", "#e53935"),
-            ],
-        }
-
-        theme_colors = color_schemes.get(theme.name, color_schemes["cute_forest"])
-        return rng.choice(theme_colors)
+        return _creature_colors(theme.name, creature_index)
 
     def _get_creature_shape(self, creature_index: int) -> str:
         """
@@ -147,8 +284,7 @@ class PlaceholderGenerator(PixelArtGenerator):
         Returns:
             Shape type identifier
         """
-        shapes = ["blob", "quadruped", "biped", "flying", "serpent"]
-        return shapes[creature_index % len(shapes)]
+        return _SHAPES[creature_index % len(_SHAPES)]
 
     def generate_single_creature(
         self,
@@ -169,182 +305,225 @@ class PlaceholderGenerator(PixelArtGenerator):
         Returns:
             PIL Image with transparent background
         """
-        img = Image.new("RGBA", self.resolution, (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-
-        width, height = self.resolution
         colors = self._get_creature_colors(theme, creature_index)
         shape = self._get_creature_shape(creature_index)
 
         # Animation offset
         offset = self._get_animation_offset(animation_type, frame_index)
 
-        # Draw creature based on shape
-        if shape == "blob":
-            self._draw_blob_creature(draw, width, height, colors, offset)
-        elif shape == "quadruped":
-            self._draw_quadruped_creature(draw, width, height, colors, offset)
-        elif shape == "biped":
-            self._draw_biped_creature(draw, width, height, colors, offset)
-        elif shape == "flying":
-            self._draw_flying_creature(draw, width, height, colors, offset)
-        else:  # serpent
-            self._draw_serpent_creature(draw, width, height, colors, offset)
-
-        return img
+        # Frames only differ by pose, so each distinct pose is drawn once
+        pose = (shape, colors, offset)
+        img = self._pose_cache.get(pose)
+        if img is None:
+            img = self._draw_creature(shape, colors, offset)
+            self._pose_cache[pose] = img
 
-    def _get_animation_offset(self, animation_type: AnimationType, frame_index: int) -> int:
-        """Calculate pixel offset for animation frame."""
-        if animation_type == AnimationType.IDLE:
-            # Gentle bobbing
-            return (frame_index % 2) * 1
-        elif animation_type == AnimationType.WALK:
-            # Up and down motion
-            return [0, 1, 0, -1][frame_index % 4]
-        else:  # ATTACK
-            # Forward thrust
-            return [0, 2, 1, 0][frame_index % 4]
-
-    def _draw_blob_creature(
-        self, draw: ImageDraw.ImageDraw, w: int, h: int, colors: Tuple[str, str, str], offset: int
-    ) -> None:
-        """Draw a blob-shaped creature."""
-        primary, secondary, accent = colors
-        center_x, center_y = w // 2, h // 2 + offset
-
-        # Body
-        body_size = min(w, h) // 3
-        draw.ellipse(
-            [center_x - body_size, center_y - body_size, center_x + body_size, center_y + body_size],
-            fill=primary,
-            outline=secondary,
-        )
+        return img.copy()
 
-        # Eyes
-        eye_y = center_y - body_size // 3
-        draw.rectangle([center_x - body_size // 2, eye_y, center_x - body_size // 3, eye_y + 2], fill=accent)
-        draw.rectangle([center_x + body_size // 3, eye_y, center_x + body_size // 2, eye_y + 2], fill=accent)
-
-    def _draw_quadruped_creature(
-        self, draw: ImageDraw.ImageDraw, w: int, h: int, colors: Tuple[str, str, str], offset: int
-    ) -> None:
-        """Draw a four-legged creature."""
-        primary, secondary, accent = colors
-        center_x, center_y = w // 2, h // 2 + offset
-
-        # Body
-        body_w, body_h = w // 2, h // 3
-        draw.rectangle(
-            [center_x - body_w // 2, center_y - body_h // 2, center_x + body_w // 2, center_y + body_h // 2],
-            fill=primary,
-            outline=secondary,
-        )
+    def _draw_creature(self, shape: str, colors: CreatureColors, offset: int) -> Image.Image:
+        """
+        Draw a creature pose onto the scratch canvas and return a copy.
 
-        # Legs
-        leg_h = h // 4
-        for leg_x in [center_x - body_w // 2, center_x + body_w // 2 - 2]:
-            draw.rectangle(
-                [leg_x, center_y + body_h // 2, leg_x + 2, center_y + body_h // 2 + leg_h],
-                fill=secondary,
-            )
+        Args:
+            shape: Shape type identifier
+            colors: Tuple of (primary_color, secondary_color, accent_color)
+            offset: Vertical animation offset in pixels
 
-        # Head
-        head_size = body_h
-        draw.ellipse(
-            [center_x + body_w // 2 - 2, center_y - head_size, center_x + body_w // 2 + head_size, center_y],
-            fill=primary,
-            outline=accent,
-        )
+        Returns:
+            PIL Image with transparent background
+        """
+        draw = self._draw
+        width, height = self.resolution
+        # Clear the previous pose
+        self._canvas.paste((0, 0, 0, 0), (0, 0, width, height))
+
+        for kind, coords, fill, outline in self._layout[shape]:
+            fill_color = colors[fill] if fill is not None else None
+            outline_color = colors[outline] if outline is not None else None
+
+            if kind == "polygon":
+                points = [(x, y + offset) for x, y in coords]
+                draw.polygon(points, fill=fill_color, outline=outline_color)
+            else:
+                x0, y0, x1, y1 = coords
+                box = [x0, y0 + offset, x1, y1 + offset]
+                if kind == "ellipse":
+                    draw.ellipse(box, fill=fill_color, outline=outline_color)
+                else:
+                    draw.rectangle(box, fill=fill_color, outline=outline_color)
+
+        return self._canvas.copy()
 
-    def _draw_biped_creature(
-        self, draw: ImageDraw.ImageDraw, w: int, h: int, colors: Tuple[str, str, str], offset: int
-    ) -> None:
-        """Draw a two-legged creature."""
-        primary, secondary, accent = colors
-        center_x, center_y = w // 2, h // 2 + offset
-
-        # Body
-        body_w, body_h = w // 4, h // 2
-        draw.rectangle(
-            [center_x - body_w // 2, center_y - body_h // 2, center_x + body_w // 2, center_y + body_h // 2],
-            fill=primary,
-            outline=secondary,
-        )
+    def _get_animation_offset(self, animation_type: AnimationType, frame_index: int) -> int:
+        """Calculate pixel offset for animation frame."""
+        offsets = self._ANIMATION_OFFSETS[animation_type]
+        return offsets[frame_index % len(offsets)]
 
-        # Head
-        head_size = body_w + 2
-        draw.ellipse(
-            [center_x - head_size // 2, center_y - body_h // 2 - head_size,
-             center_x + head_size // 2, center_y - body_h // 2],
-            fill=primary,
-            outline=accent,
-        )
+    @staticmethod
+    def _build_layout(w: int, h: int) -> Dict[str, List[Primitive]]:
+        """
+        Resolve every shape's primitives for a resolution, at offset 0.
 
-        # Legs
-        leg_w, leg_h = 2, h // 4
-        draw.rectangle(
-            [center_x - body_w // 2, center_y + body_h // 2,
-             center_x - body_w // 2 + leg_w, center_y + body_h // 2 + leg_h],
-            fill=secondary,
-        )
-        draw.rectangle(
-            [center_x + body_w // 2 - leg_w, center_y + body_h // 2,
-             center_x + body_w // 2, center_y + body_h // 2 + leg_h],
-            fill=secondary,
-        )
+        Args:
+            w: Frame width
+            h: Frame height
 
-    def _draw_flying_creature(
-        self, draw: ImageDraw.ImageDraw, w: int, h: int, colors: Tuple[str, str, str], offset: int
-    ) -> None:
-        """Draw a flying creature."""
-        primary, secondary, accent = colors
-        center_x, center_y = w // 2, h // 2 + offset
-
-        # Body
-        body_size = min(w, h) // 4
-        draw.ellipse(
-            [center_x - body_size, center_y - body_size // 2,
-             center_x + body_size, center_y + body_size // 2],
-            fill=primary,
-            outline=secondary,
-        )
+        Returns:
+            Dictionary mapping shape type to its drawing primitives
+        """
+        return {
+            "blob": _blob_layout(w, h),
+            "quadruped": _quadruped_layout(w, h),
+            "biped": _biped_layout(w, h),
+            "flying": _flying_layout(w, h),
+            "serpent": _serpent_layout(w, h),
+        }
 
-        # Wings
-        wing_size = body_size + 4
-        draw.polygon(
-            [
-                (center_x - body_size, center_y),
-                (center_x - body_size - wing_size, center_y - wing_size // 2),
-                (center_x - body_size - wing_size, center_y + wing_size // 2),
-            ],
-            fill=secondary,
-            outline=accent,
-        )
-        draw.polygon(
-            [
-                (center_x + body_size, center_y),
-                (center_x + body_size + wing_size, center_y - wing_size // 2),
-                (center_x + body_size + wing_size, center_y + wing_size // 2),
-            ],
-            fill=secondary,
-            outline=accent,
-        )
 
-    def _draw_serpent_creature(
-        self, draw: ImageDraw.ImageDraw, w: int, h: int, colors: Tuple[str, str, str], offset: int
-    ) -> None:
-        """Draw a serpentine creature."""
-        primary, secondary, accent = colors
-        center_y = h // 2 + offset
-
-        # Segmented body
-        segment_size = min(w, h) // 8
-        num_segments = 5
-        for i in range(num_segments):
-            x = w // 4 + (i * w // (num_segments + 2))
-            y_wave = center_y + int((i % 2) * segment_size // 2)
-            draw.ellipse(
-                [x - segment_size, y_wave - segment_size, x + segment_size, y_wave + segment_size],
-                fill=primary if i % 2 == 0 else secondary,
-                outline=accent,
+def _blob_layout(w: int, h: int) -> List[Primitive]:
+    """Lay out a blob-shaped creature."""
+    center_x, center_y = w // 2, h // 2
+
+    # Body
+    body_size = min(w, h) // 3
+    body = (center_x - body_size, center_y - body_size, center_x + body_size, center_y + body_size)
+
+    # Eyes
+    eye_y = center_y - body_size // 3
+    left_eye = (center_x - body_size // 2, eye_y, center_x - body_size // 3, eye_y + 2)
+    right_eye = (center_x + body_size // 3, eye_y, center_x + body_size // 2, eye_y + 2)
+    return [
+        ("ellipse", body, PRIMARY, SECONDARY),
+        ("rectangle", left_eye, ACCENT, None),
+        ("rectangle", right_eye, ACCENT, None),
+    ]
+
+
+def _quadruped_layout(w: int, h: int) -> List[Primitive]:
+    """Lay out a four-legged creature."""
+    center_x, center_y = w // 2, h // 2
+
+    # Body
+    body_w, body_h = w // 2, h // 3
+    body = (
+        center_x - body_w // 2,
+        center_y - body_h // 2,
+        center_x + body_w // 2,
+        center_y + body_h // 2,
+    )
+    primitives: List[Primitive] = [("rectangle", body, PRIMARY, SECONDARY)]
+
+    # Legs
+    leg_h = h // 4
+    for leg_x in [center_x - body_w // 2, center_x + body_w // 2 - 2]:
+        leg = (leg_x, center_y + body_h // 2, leg_x + 2, center_y + body_h // 2 + leg_h)
+        primitives.append(("rectangle", leg, SECONDARY, None))
+
+    # Head
+    head_size = body_h
+    head = (
+        center_x + body_w // 2 - 2,
+        center_y - head_size,
+        center_x + body_w // 2 + head_size,
+        center_y,
+    )
+    primitives.append(("ellipse", head, PRIMARY, ACCENT))
+    return primitives
+
+
+def _biped_layout(w: int, h: int) -> List[Primitive]:
+    """Lay out a two-legged creature."""
+    center_x, center_y = w // 2, h // 2
+
+    # Body
+    body_w, body_h = w // 4, h // 2
+    body = (
+        center_x - body_w // 2,
+        center_y - body_h // 2,
+        center_x + body_w // 2,
+        center_y + body_h // 2,
+    )
+
+    # Head
+    head_size = body_w + 2
+    head = (
+        center_x - head_size // 2,
+        center_y - body_h // 2 - head_size,
+        center_x + head_size // 2,
+        center_y - body_h // 2,
+    )
+
+    # Legs
+    leg_w, leg_h = 2, h // 4
+    left_leg = (
+        center_x - body_w // 2,
+        center_y + body_h // 2,
+        center_x - body_w // 2 + leg_w,
+        center_y + body_h // 2 + leg_h,
+    )
+    right_leg = (
+        center_x + body_w // 2 - leg_w,
+        center_y + body_h // 2,
+        center_x + body_w // 2,
+        center_y + body_h // 2 + leg_h,
+    )
+    return [
+        ("rectangle", body, PRIMARY, SECONDARY),
+        ("ellipse", head, PRIMARY, ACCENT),
+        ("rectangle", left_leg, SECONDARY, None),
+        ("rectangle", right_leg, SECONDARY, None),
+    ]
+
+
+def _flying_layout(w: int, h: int) -> List[Primitive]:
+    """Lay out a flying creature."""
+    center_x, center_y = w // 2, h // 2
+
+    # Body
+    body_size = min(w, h) // 4
+    body = (
+        center_x - body_size,
+        center_y - body_size // 2,
+        center_x + body_size,
+        center_y + body_size // 2,
+    )
+
+    # Wings
+    wing_size = body_size + 4
+    left_wing = (
+        (center_x - body_size, center_y),
+        (center_x - body_size - wing_size, center_y - wing_size // 2),
+        (center_x - body_size - wing_size, center_y + wing_size // 2),
+    )
+    right_wing = (
+        (center_x + body_size, center_y),
+        (center_x + body_size + wing_size, center_y - wing_size // 2),
+        (center_x + body_size + wing_size, center_y + wing_size // 2),
+    )
+    return [
+        ("ellipse", body, PRIMARY, SECONDARY),
+        ("polygon", left_wing, SECONDARY, ACCENT),
+        ("polygon", right_wing, SECONDARY, ACCENT),
+    ]
+
+
+def _serpent_layout(w: int, h: int) -> List[Primitive]:
+    """Lay out a serpentine creature."""
+    center_y = h // 2
+
+    # Segmented body
+    segment_size = min(w, h) // 8
+    num_segments = 5
+    primitives: List[Primitive] = []
+    for i in range(num_segments):
+        x = w // 4 + (i * w // (num_segments + 2))
+        y_wave = center_y + int((i % 2) * segment_size // 2)
+        primitives.append(
+            (
+                "ellipse",
+                (x - segment_size, y_wave - segment_size, x + segment_size, y_wave + segment_size),
+                PRIMARY if i % 2 == 0 else SECONDARY,
+                ACCENT,
             )
+        )
+    return primitives
@@ -3,12 +3,122 @@ Metadata generation and management for asset packs.
 """
 
 import json
-from datetime import datetime
+import sys
+from dataclasses import fields
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from string import Template
+from typing import Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # optional, install with the "fast" extra
+    orjson = None  # type: ignore[assignment]
 
 from pixel_factory.models import AnimationType, CreatureMetadata, PackMetadata
 
+# README body, filled in with Template.substitute by generate_readme
+_README_TEMPLATE = Template("""# ${pack_name}
+
+## Pack Information
+
+- **Theme**: ${theme_name}
+- **Resolution**: ${width}x${height} pixels
+- **Creatures**: ${num_creatures}
+- **Color Variants**: ${num_variants} per creature
+- **Generated**: ${generation_date}
+
+## Animations Included
+
+Each creature includes the following animations:
+${animation_list}
+## File Structure
+
+```
+${pack_name}/
+├── creatures/
+│   ├── creature_001/
+│   │   ├── idle/
+│   │   │   ├── frame_01.png
+│   │   │   ├── frame_02.png
+│   │   │   ├── frame_03.png
+│   │   │   └── frame_04.png
+│   │   ├── walk/
+│   │   │   └── ...
+│   │   ├── attack/
+│   │   │   └── ...
+│   │   └── sprite_sheets/
+│   │       ├── idle.png
+│   │       ├── walk.png
+${sheet_tree}
+│   └── creature_002/
+│       └── ...
+├── previews/
+│   └── pack_preview.png
+├── metadata.json
+└── README.txt
+```
+
+## Sprite Sheets
+
+${sheet_list}
+
+## Color Variants
+
+Color variants are generated programmatically from the base creature. Variant files include `_variant_N` in their filename.
+
+## Usage in Game Engines
+
+### Unity
+1. Import sprite sheets into your project
+2. Use the Sprite Editor to slice the sprite sheet
+3. Set pixels per unit to match your game's scale
+4. Create animation clips using the sliced sprites
+
+### Godot
+1. Import sprite sheets as Texture
+2. Create AnimatedSprite node
+3. Add frames from sprite sheet
+4. Configure animation speed and looping
+
+### Pygame
+```python
+sprite_sheet = pygame.image.load('${pygame_sheet}')
+frame_width = ${width}
+frame_height = ${height}
+# Extract frames and animate
+```
+
+## License
+
+This asset pack was generated using Pixel Factory.
+Use these assets freely in your commercial or non-commercial projects.
+
+## Credits
+
+Generated with Pixel Factory - https://github.com/yourusername/pixel-factory
+""")
+
+# README sections that list combined.png only when combined sheets are built
+_README_SHEET_TREE = {
+    True: "│   │       ├── attack.png\n│   │       └── combined.png",
+    False: "│   │       └── attack.png",
+}
+_README_SHEET_LIST = {
+    True: (
+        "Each creature has individual sprite sheets for each animation type, "
+        "plus a combined sprite sheet:\n\n"
+        "- **Individual sheets** (e.g., `idle.png`): Single row of frames for one animation\n"
+        "- **Combined sheet** (`combined.png`): All animations stacked vertically in order: "
+        "idle, walk, attack"
+    ),
+    False: (
+        "Each creature has individual sprite sheets for each animation type:\n\n"
+        "- **Individual sheets** (e.g., `idle.png`): Single row of frames for one animation"
+    ),
+}
+
 
 def create_pack_metadata(
     pack_id: str,
@@ -36,7 +146,7 @@ def create_pack_metadata(
         pack_id=pack_id,
         pack_name=pack_name,
         theme_name=theme_name,
-        generation_date=datetime.utcnow().isoformat(),
+        generation_date=datetime.now(timezone.utc).isoformat(),
         resolution=resolution,
         num_creatures=num_creatures,
         num_variants=num_variants,
@@ -44,6 +154,12 @@ def create_pack_metadata(
     )
 
 
+@lru_cache(maxsize=8)
+def _animation_template(frames_per_animation: int) -> Dict[str, int]:
+    """Build the animation -> frame count mapping; callers must copy it."""
+    return {anim.value: frames_per_animation for anim in AnimationType}
+
+
 def create_creature_metadata(
     creature_id: str,
     theme: str,
@@ -52,6 +168,7 @@ def create_creature_metadata(
     resolution: tuple[int, int],
     sprite_sheet_paths: Dict[str, str],
     frames_per_animation: int = 4,
+    generation_time: Optional[str] = None,
 ) -> CreatureMetadata:
     """
     Create metadata for a creature.
@@ -64,20 +181,23 @@ def create_creature_metadata(
         resolution: Creature resolution
         sprite_sheet_paths: Dictionary mapping animation types to file paths
         frames_per_animation: Number of frames per animation
+        generation_time: ISO timestamp shared by the pack (defaults to now)
 
     Returns:
         CreatureMetadata object
     """
-    animations = {anim.value: frames_per_animation for anim in AnimationType}
+    # Copy the cached template since the dataclass keeps a reference to it
+    animations = dict(_animation_template(frames_per_animation))
 
     return CreatureMetadata(
         creature_id=creature_id,
-        theme=theme,
-        base_color=base_color,
+        theme=sys.intern(theme),
+        base_color=sys.intern(base_color),
         variant_index=variant_index,
         resolution=resolution,
         animations=animations,
         sprite_sheet_paths=sprite_sheet_paths,
+        generation_time=generation_time or datetime.now(timezone.utc).isoformat(),
     )
 
 
@@ -91,8 +211,32 @@ def save_metadata(metadata: PackMetadata, output_path: Path) -> None:
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w") as f:
-        json.dump(metadata.to_dict(), f, indent=2)
+    if orjson is not None:
+        # orjson walks the dataclasses natively (tuples become arrays), which
+        # skips building the intermediate dicts that to_dict() returns
+        output_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+        return
+
+    output_path.write_text(json.dumps(metadata.to_dict(), indent=2), encoding="utf-8")
+
+
+# Keys of a creature's JSON dict that map to CreatureMetadata fields
+_CREATURE_FIELDS = frozenset(field.name for field in fields(CreatureMetadata))
+
+
+def _creature_from_dict(creature_data: dict) -> CreatureMetadata:
+    """Build CreatureMetadata from its JSON dict, reusing the dict for kwargs."""
+    creature_data["resolution"] = tuple(creature_data["resolution"])
+    # Every creature in a pack repeats the same theme and a few colors
+    creature_data["theme"] = sys.intern(creature_data["theme"])
+    creature_data["base_color"] = sys.intern(creature_data["base_color"])
+    creature_data.setdefault("generation_time", "")
+    if not creature_data.keys() <= _CREATURE_FIELDS:
+        # Older or hand-edited files may carry extra keys; ignore them
+        creature_data = {
+            key: value for key, value in creature_data.items() if key in _CREATURE_FIELDS
+        }
+    return CreatureMetadata(**creature_data)
 
 
 def load_metadata(metadata_path: Path) -> PackMetadata:
@@ -105,23 +249,10 @@ def load_metadata(metadata_path: Path) -> PackMetadata:
     Returns:
         PackMetadata object
     """
-    with open(metadata_path, "r") as f:
-        data = json.load(f)
-
-    creatures = []
-    for creature_data in data.get("creatures", []):
-        creatures.append(
-            CreatureMetadata(
-                creature_id=creature_data["creature_id"],
-                theme=creature_data["theme"],
-                base_color=creature_data["base_color"],
-                variant_index=creature_data["variant_index"],
-                resolution=tuple(creature_data["resolution"]),
-                animations=creature_data["animations"],
-                sprite_sheet_paths=creature_data["sprite_sheet_paths"],
-                generation_time=creature_data.get("generation_time", ""),
-            )
-        )
+    raw = metadata_path.read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+    creatures = [_creature_from_dict(c) for c in data.get("creatures", ())]
 
     return PackMetadata(
         pack_id=data["pack_id"],
@@ -131,124 +262,53 @@ def load_metadata(metadata_path: Path) -> PackMetadata:
         resolution=tuple(data["resolution"]),
         num_creatures=data["num_creatures"],
         num_variants=data["num_variants"],
-        animation_types=data["animation_types"],
+        animation_types=[sys.intern(anim) for anim in data["animation_types"]],
         creatures=creatures,
     )
 
 
-def generate_readme(pack_metadata: PackMetadata) -> str:
+def generate_readme(pack_metadata: PackMetadata, build_combined: bool = True) -> str:
     """
     Generate README content for the pack.
 
     Args:
         pack_metadata: Metadata for the pack
+        build_combined: Whether the pack includes combined sprite sheets
 
     Returns:
         README content as string
     """
-    readme = f"""# {pack_metadata.pack_name}
-
-## Pack Information
-
-- **Theme**: {pack_metadata.theme_name}
-- **Resolution**: {pack_metadata.resolution[0]}x{pack_metadata.resolution[1]} pixels
-- **Creatures**: {pack_metadata.num_creatures}
-- **Color Variants**: {pack_metadata.num_variants} per creature
-- **Generated**: {pack_metadata.generation_date}
-
-## Animations Included
-
-Each creature includes the following animations:
-"""
-
-    for anim_type in pack_metadata.animation_types:
-        readme += f"- **{anim_type.capitalize()}**: 4 frames\n"
-
-    readme += """
-## File Structure
-
-```
-{pack_name}/
-├── creatures/
-│   ├── creature_001/
-│   │   ├── idle/
-│   │   │   ├── frame_01.png
-│   │   │   ├── frame_02.png
-│   │   │   ├── frame_03.png
-│   │   │   └── frame_04.png
-│   │   ├── walk/
-│   │   │   └── ...
-│   │   ├── attack/
-│   │   │   └── ...
-│   │   └── sprite_sheets/
-│   │       ├── idle.png
-│   │       ├── walk.png
-│   │       ├── attack.png
-│   │       └── combined.png
-│   └── creature_002/
-│       └── ...
-├── previews/
-│   └── pack_preview.png
-├── metadata.json
-└── README.txt
-```
-
-## Sprite Sheets
-
-Each creature has individual sprite sheets for each animation type, plus a combined sprite sheet:
-
-- **Individual sheets** (e.g., `idle.png`): Single row of frames for one animation
-- **Combined sheet** (`combined.png`): All animations stacked vertically in order: idle, walk, attack
-
-## Color Variants
-
-Color variants are generated programmatically from the base creature. Variant files include `_variant_N` in their filename.
-
-## Usage in Game Engines
-
-### Unity
-1. Import sprite sheets into your project
-2. Use the Sprite Editor to slice the sprite sheet
-3. Set pixels per unit to match your game's scale
-4. Create animation clips using the sliced sprites
-
-### Godot
-1. Import sprite sheets as Texture
-2. Create AnimatedSprite node
-3. Add frames from sprite sheet
-4. Configure animation speed and looping
-
-### Pygame
-```python
-sprite_sheet = pygame.image.load('combined.png')
-frame_width = {pack_metadata.resolution[0]}
-frame_height = {pack_metadata.resolution[1]}
-# Extract frames and animate
-```
-
-## License
-
-This asset pack was generated using Pixel Factory.
-Use these assets freely in your commercial or non-commercial projects.
-
-## Credits
-
-Generated with Pixel Factory - https://github.com/yourusername/pixel-factory
-"""
+    animation_list = "".join(
+        f"- **{anim_type.capitalize()}**: 4 frames\n" for anim_type in pack_metadata.animation_types
+    )
 
-    return readme
+    return _README_TEMPLATE.substitute(
+        pack_name=pack_metadata.pack_name,
+        theme_name=pack_metadata.theme_name,
+        width=pack_metadata.resolution[0],
+        height=pack_metadata.resolution[1],
+        num_creatures=pack_metadata.num_creatures,
+        num_variants=pack_metadata.num_variants,
+        generation_date=pack_metadata.generation_date,
+        animation_list=animation_list,
+        sheet_tree=_README_SHEET_TREE[build_combined],
+        sheet_list=_README_SHEET_LIST[build_combined],
+        pygame_sheet="combined.png" if build_combined else "idle.png",
+    )
 
 
-def save_readme(pack_metadata: PackMetadata, output_path: Path) -> None:
+def save_readme(
+    pack_metadata: PackMetadata, output_path: Path, build_combined: bool = True
+) -> None:
     """
     Save README file for the pack.
 
     Args:
         pack_metadata: Metadata for the pack
         output_path: Path to save README
+        build_combined: Whether the pack includes combined sprite sheets
     """
-    readme_content = generate_readme(pack_metadata)
+    readme_content = generate_readme(pack_metadata, build_combined)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w") as f:
-        f.write(readme_content)
+    output_path.write_text(readme_content, encoding="utf-8")
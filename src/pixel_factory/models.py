@@ -2,11 +2,15 @@
 Data models and structures for pixel creature generation.
 """
 
+import sys
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class AnimationType(Enum):
@@ -17,15 +21,15 @@ class AnimationType(Enum):
     ATTACK = "attack"
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ThemeConfig:
-    """Configuration for a visual theme."""
+    """Configuration for a visual theme (immutable, shared by all frames)."""
 
     name: str
     description: str
     base_description: str
-    mood_adjectives: List[str]
-    color_palette_hints: List[str]
+    mood_adjectives: Sequence[str]
+    color_palette_hints: Sequence[str]
     background_color: str = "#1a1a1a"
 
     def build_prompt(self, creature_index: int) -> str:
@@ -48,7 +52,7 @@ class ThemeConfig:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CreatureMetadata:
     """Metadata for a single generated creature."""
 
@@ -59,7 +63,7 @@ class CreatureMetadata:
     resolution: Tuple[int, int]
     animations: Dict[str, int]  # animation_type -> frame_count
     sprite_sheet_paths: Dict[str, str]  # animation_type -> file_path
-    generation_time: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    generation_time: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
@@ -75,7 +79,7 @@ class CreatureMetadata:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PackMetadata:
     """Metadata for a complete asset pack."""
 
@@ -104,9 +108,21 @@ class PackMetadata:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class GenerationConfig:
-    """Configuration for a generation run."""
+    """
+    Configuration for a generation run.
+
+    ``archive_compression`` is the ``zipfile`` compression method for the pack
+    archive. When None, PNGs are stored uncompressed (PNG is already
+    DEFLATE-compressed) and other files use fast ``ZIP_DEFLATED``.
+
+    ``num_workers`` is the number of processes generating creatures; 1 runs
+    everything in-process and None uses one per CPU.
+
+    ``build_combined`` controls whether each creature variant also gets a
+    ``combined.png`` sheet holding all of its animations.
+    """
 
     pack_name: str
     theme_name: str
@@ -115,6 +131,9 @@ class GenerationConfig:
     num_variants: int
     output_dir: Path
     frames_per_animation: int = 4
+    archive_compression: Optional[int] = None
+    num_workers: Optional[int] = 1
+    build_combined: bool = True
 
     @property
     def animation_types(self) -> List[AnimationType]:
@@ -3,20 +3,141 @@ Packaging and export functionality for asset packs.
 """
 
 import logging
+import os
 import shutil
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 from pixel_factory.models import PackMetadata
 
 logger = logging.getLogger(__name__)
 
+# Threads reading pack files for the archive, and files buffered per batch
+_ARCHIVE_READ_WORKERS = 8
+_ARCHIVE_READ_BATCH = 256
+
+# Formats whose data is already compressed; re-deflating them gains almost nothing
+_STORED_SUFFIXES = frozenset({".png", ".gif", ".jpg", ".jpeg", ".webp", ".zip"})
+
+
+@dataclass
+class _PackScan:
+    """Everything export needs to know about a pack, gathered in one walk."""
+
+    files: List[Path] = field(default_factory=list)
+    stats: dict = field(default_factory=dict)
+    # Names of entries directly inside the pack directory
+    top_level: Set[str] = field(default_factory=set)
+    # Creature directory name -> names of its subdirectories, in walk order
+    creature_subdirs: Dict[str, Set[str]] = field(default_factory=dict)
+
+
+def _scan_pack(pack_dir: Path) -> _PackScan:
+    """
+    Walk a pack directory once, collecting files, statistics and structure.
+
+    Args:
+        pack_dir: Pack directory
+
+    Returns:
+        Scan results (empty if the directory doesn't exist)
+    """
+    stats = {
+        "total_files": 0,
+        "total_size_bytes": 0,
+        "num_creatures": 0,
+        "num_frames": 0,
+        "num_sprite_sheets": 0,
+    }
+    scan = _PackScan(stats=stats)
+
+    if pack_dir.is_dir():
+        _walk_pack_dir(os.fspath(pack_dir), (), scan)
+
+    stats["num_creatures"] = len(scan.creature_subdirs)
+
+    # Convert size to MB
+    stats["total_size_mb"] = round(stats["total_size_bytes"] / (1024 * 1024), 2)
+
+    return scan
+
+
+def _walk_pack_dir(directory: str, parts: Tuple[str, ...], scan: _PackScan) -> None:
+    """
+    Recursively add a directory's contents to a pack scan.
+
+    Uses ``os.scandir`` so file types and sizes come from the cached
+    ``DirEntry`` data instead of a ``Path`` object and extra stat per file.
+
+    Args:
+        directory: Directory to walk
+        parts: Path components of ``directory`` relative to the pack root
+        scan: Scan being filled in
+    """
+    stats = scan.stats
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not parts:
+                scan.top_level.add(entry.name)
+
+            if entry.is_dir(follow_symlinks=False):
+                if parts == ("creatures",):
+                    scan.creature_subdirs.setdefault(entry.name, set())
+                elif len(parts) == 2 and parts[0] == "creatures":
+                    scan.creature_subdirs.setdefault(parts[1], set()).add(entry.name)
+                _walk_pack_dir(entry.path, parts + (entry.name,), scan)
+            elif entry.is_file():
+                scan.files.append(Path(entry.path))
+                stats["total_files"] += 1
+                stats["total_size_bytes"] += entry.stat().st_size
+
+                if "frame_" in entry.name:
+                    stats["num_frames"] += 1
+                elif parts and parts[-1] == "sprite_sheets":
+                    stats["num_sprite_sheets"] += 1
+
+
+def _validate_scan(pack_dir: Path, scan: _PackScan) -> bool:
+    """
+    Check a pack scan against the expected pack structure.
+
+    Args:
+        pack_dir: Pack directory that was scanned
+        scan: Results of scanning ``pack_dir``
+
+    Returns:
+        True if structure is valid, False otherwise
+    """
+    for name in ("creatures", "metadata.json", "README.txt"):
+        if name not in scan.top_level:
+            logger.error(f"Missing required path: {pack_dir / name}")
+            return False
+
+    # Check for at least one creature
+    if not scan.creature_subdirs:
+        logger.error("No creature directories found")
+        return False
+
+    # Validate first creature has required structure
+    first_creature, subdirs = next(iter(scan.creature_subdirs.items()))
+    first_creature_dir = pack_dir / "creatures" / first_creature
+    for subdir in ["idle", "walk", "attack", "sprite_sheets"]:
+        if subdir not in subdirs:
+            logger.error(f"Missing required subdirectory: {first_creature_dir / subdir}")
+            return False
+
+    logger.info("Pack structure validation passed")
+    return True
+
 
 def create_pack_archive(
     pack_dir: Path,
     output_path: Optional[Path] = None,
-    compression: int = zipfile.ZIP_DEFLATED,
+    compression: Optional[int] = None,
+    files: Optional[List[Path]] = None,
 ) -> Path:
     """
     Create a ZIP archive of the complete asset pack.
@@ -24,7 +145,11 @@ def create_pack_archive(
     Args:
         pack_dir: Directory containing the pack
         output_path: Optional custom output path for the zip file
-        compression: Compression method (default: ZIP_DEFLATED)
+        compression: Compression method for every entry (default: ZIP_STORED
+            for PNGs and other compressed formats, ZIP_DEFLATED at level 1 for
+            everything else)
+        files: Optional files to archive, as found by a previous scan of the
+            pack (default: every file under ``pack_dir``)
 
     Returns:
         Path to the created ZIP file
@@ -34,12 +159,31 @@ def create_pack_archive(
 
     logger.info(f"Creating archive: {output_path}")
 
-    with zipfile.ZipFile(output_path, "w", compression) as zipf:
-        for file_path in pack_dir.rglob("*"):
-            if file_path.is_file():
-                arcname = file_path.relative_to(pack_dir.parent)
-                zipf.write(file_path, arcname)
-                logger.debug(f"Added to archive: {arcname}")
+    if files is None:
+        files = _scan_pack(pack_dir).files
+    files = sorted(files)
+
+    def read_entry(file_path: Path) -> Tuple[zipfile.ZipInfo, bytes]:
+        zinfo = zipfile.ZipInfo.from_file(file_path, file_path.relative_to(pack_dir.parent))
+        return zinfo, file_path.read_bytes()
+
+    # Files are read on worker threads (file I/O releases the GIL) while this
+    # thread is the only writer, since ZipFile is not thread-safe
+    with zipfile.ZipFile(output_path, "w") as zipf, ThreadPoolExecutor(
+        max_workers=_ARCHIVE_READ_WORKERS
+    ) as executor:
+        for start in range(0, len(files), _ARCHIVE_READ_BATCH):
+            batch = files[start : start + _ARCHIVE_READ_BATCH]
+            for file_path, (zinfo, data) in zip(batch, executor.map(read_entry, batch)):
+                if compression is not None:
+                    compress_type, compresslevel = compression, None
+                elif file_path.suffix.lower() in _STORED_SUFFIXES:
+                    compress_type, compresslevel = zipfile.ZIP_STORED, None
+                else:
+                    # Metadata and README are tiny, so the fastest level is enough
+                    compress_type, compresslevel = zipfile.ZIP_DEFLATED, 1
+                zipf.writestr(zinfo, data, compress_type=compress_type, compresslevel=compresslevel)
+                logger.debug(f"Added to archive: {zinfo.filename}")
 
     logger.info(f"Archive created successfully: {output_path}")
     return output_path
@@ -106,36 +250,7 @@ def validate_pack_structure(pack_dir: Path) -> bool:
     Returns:
         True if structure is valid, False otherwise
     """
-    required_paths = [
-        pack_dir / "creatures",
-        pack_dir / "metadata.json",
-        pack_dir / "README.txt",
-    ]
-
-    for path in required_paths:
-        if not path.exists():
-            logger.error(f"Missing required path: {path}")
-            return False
-
-    # Check for at least one creature
-    creatures_dir = pack_dir / "creatures"
-    creature_dirs = [d for d in creatures_dir.iterdir() if d.is_dir()]
-
-    if not creature_dirs:
-        logger.error("No creature directories found")
-        return False
-
-    # Validate first creature has required structure
-    first_creature = creature_dirs[0]
-    required_subdirs = ["idle", "walk", "attack", "sprite_sheets"]
-
-    for subdir in required_subdirs:
-        if not (first_creature / subdir).exists():
-            logger.error(f"Missing required subdirectory: {first_creature / subdir}")
-            return False
-
-    logger.info("Pack structure validation passed")
-    return True
+    return _validate_scan(pack_dir, _scan_pack(pack_dir))
 
 
 def get_pack_statistics(pack_dir: Path) -> dict:
@@ -148,37 +263,7 @@ def get_pack_statistics(pack_dir: Path) -> dict:
     Returns:
         Dictionary with statistics
     """
-    stats = {
-        "total_files": 0,
-        "total_size_bytes": 0,
-        "num_creatures": 0,
-        "num_frames": 0,
-        "num_sprite_sheets": 0,
-    }
-
-    if not pack_dir.exists():
-        return stats
-
-    # Count files and sizes
-    for file_path in pack_dir.rglob("*"):
-        if file_path.is_file():
-            stats["total_files"] += 1
-            stats["total_size_bytes"] += file_path.stat().st_size
-
-            if "frame_" in file_path.name:
-                stats["num_frames"] += 1
-            elif file_path.parent.name == "sprite_sheets":
-                stats["num_sprite_sheets"] += 1
-
-    # Count creatures
-    creatures_dir = pack_dir / "creatures"
-    if creatures_dir.exists():
-        stats["num_creatures"] = len([d for d in creatures_dir.iterdir() if d.is_dir()])
-
-    # Convert size to MB
-    stats["total_size_mb"] = round(stats["total_size_bytes"] / (1024 * 1024), 2)
-
-    return stats
+    return _scan_pack(pack_dir).stats
 
 
 def export_pack(
@@ -187,6 +272,7 @@ def export_pack(
     pack_metadata: PackMetadata,
     create_archive: bool = True,
     cleanup: bool = False,
+    compression: Optional[int] = None,
 ) -> dict:
     """
     Export a complete pack with optional archiving and cleanup.
@@ -197,6 +283,7 @@ def export_pack(
         pack_metadata: Pack metadata
         create_archive: Whether to create a ZIP archive
         cleanup: Whether to clean up temporary files after archiving
+        compression: ZIP compression method (default: chosen from pack contents)
 
     Returns:
         Dictionary with export information
@@ -209,13 +296,16 @@ def export_pack(
     }
 
     try:
+        # Walk the pack once for validation, statistics and archiving
+        scan = _scan_pack(pack_dir)
+
         # Validate structure
-        if not validate_pack_structure(pack_dir):
+        if not _validate_scan(pack_dir, scan):
             logger.error("Pack structure validation failed")
             return export_info
 
         # Get statistics
-        stats = get_pack_statistics(pack_dir)
+        stats = scan.stats
         export_info["statistics"] = stats
         logger.info(f"Pack statistics: {stats}")
 
@@ -228,7 +318,7 @@ def export_pack(
                 pack_metadata.pack_id,
             )
             archive_path = output_dir / f"{archive_filename}.zip"
-            created_archive = create_pack_archive(pack_dir, archive_path)
+            created_archive = create_pack_archive(pack_dir, archive_path, compression, scan.files)
             export_info["archive_path"] = str(created_archive)
 
             # Cleanup if requested
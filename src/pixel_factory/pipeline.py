@@ -3,32 +3,38 @@ Main generation pipeline orchestration.
 """
 
 import logging
-from pathlib import Path
-from typing import List, Optional
-
-from PIL import Image
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Iterator, List, Optional
 
 from pixel_factory.config import get_config
-from pixel_factory.generator import PixelArtGenerator, PlaceholderGenerator
 from pixel_factory.metadata import (
     create_creature_metadata,
     create_pack_metadata,
     save_metadata,
     save_readme,
 )
-from pixel_factory.models import AnimationType, GenerationConfig, PackMetadata
-from pixel_factory.packaging import export_pack
-from pixel_factory.preview import create_pack_preview
-from pixel_factory.spritesheet import (
-    apply_color_variant,
-    create_animation_sprite_sheet,
-    create_combined_sprite_sheet,
-    save_frames_to_disk,
-    save_sprite_sheet,
+from pixel_factory.models import (
+    AnimationType,
+    CreatureMetadata,
+    GenerationConfig,
+    PackMetadata,
+    ThemeConfig,
 )
+from pixel_factory.packaging import export_pack
+
+# PIL and the modules built on it are imported where they are used, so that
+# importing the pipeline (e.g. for the CLI or export_pack) stays cheap
+if TYPE_CHECKING:
+    from PIL import Image
+
+    from pixel_factory.generator import PixelArtGenerator
 
 logger = logging.getLogger(__name__)
 
+# Number of creatures shown in the pack preview
+MAX_PREVIEW_SHEETS = 20
+
 
 class CreaturePackPipeline:
     """Main pipeline for generating creature asset packs."""
@@ -36,7 +42,8 @@ class CreaturePackPipeline:
     def __init__(
         self,
         config: GenerationConfig,
-        generator: Optional[PixelArtGenerator] = None,
+        generator: Optional["PixelArtGenerator"] = None,
+        theme_config: Optional[ThemeConfig] = None,
     ) -> None:
         """
         Initialize the pipeline.
@@ -44,16 +51,23 @@ class CreaturePackPipeline:
         Args:
             config: Generation configuration
             generator: Optional custom generator (defaults to PlaceholderGenerator)
+            theme_config: Optional theme (defaults to config.theme_name from the app config)
         """
+        from pixel_factory.generator import PlaceholderGenerator
+
         self.config = config
         self.generator = generator or PlaceholderGenerator(config.resolution)
-        self.theme_config = get_config().get_theme(config.theme_name)
+        self.theme_config = theme_config or get_config().get_theme(config.theme_name)
+
+        # Output locations reused for every creature variant
+        self._pack_dir = config.output_dir / config.pack_name
+        self._creatures_dir = self._pack_dir / "creatures"
 
     def generate_creature(
         self,
         creature_index: int,
         variant_index: int = 0,
-    ) -> tuple[str, dict[AnimationType, List[Image.Image]]]:
+    ) -> tuple[str, dict[AnimationType, List["Image.Image"]]]:
         """
         Generate all animation frames for a single creature.
 
@@ -64,6 +78,8 @@ class CreaturePackPipeline:
         Returns:
             Tuple of (creature_id, animation_frames_dict)
         """
+        from pixel_factory.spritesheet import apply_color_variant_batch
+
         creature_id = f"creature_{creature_index + 1:03d}"
         logger.info(f"Generating {creature_id} (variant {variant_index})")
 
@@ -84,7 +100,7 @@ class CreaturePackPipeline:
             if variant_index > 0:
                 hue_shift = variant_index * 60  # Shift hue by 60 degrees per variant
                 saturation_factor = 0.8 + (variant_index * 0.2)  # Adjust saturation
-                frames = [apply_color_variant(frame, hue_shift, saturation_factor) for frame in frames]
+                frames = apply_color_variant_batch(frames, hue_shift, saturation_factor)
 
             animation_frames[anim_type] = frames
 
@@ -93,9 +109,9 @@ class CreaturePackPipeline:
     def save_creature_assets(
         self,
         creature_id: str,
-        animation_frames: dict[AnimationType, List[Image.Image]],
+        animation_frames: dict[AnimationType, List["Image.Image"]],
         variant_index: int = 0,
-    ) -> dict[str, str]:
+    ) -> tuple[dict[str, str], dict[AnimationType, "Image.Image"]]:
         """
         Save all assets for a creature to disk.
 
@@ -105,46 +121,166 @@ class CreaturePackPipeline:
             variant_index: Color variant index
 
         Returns:
-            Dictionary mapping animation types to sprite sheet paths
+            Tuple of (sprite sheet paths by animation type name,
+            in-memory RGBA sprite sheets by animation type)
         """
-        pack_dir = self.config.output_dir / self.config.pack_name / "creatures"
-        sprite_sheet_paths = {}
+        from pixel_factory.spritesheet import (
+            PNG_MAX_COMPRESS_LEVEL,
+            create_animation_sprite_sheet,
+            create_combined_sprite_sheet,
+            get_save_executor,
+            save_frames_to_disk,
+            save_sprite_sheet,
+        )
+
+        creatures_dir = self._creatures_dir
+        sprite_sheets = {}
+        saved_frames: dict[bytes, str] = {}
+
+        # Sheets are encoded on the save pool while the frames are written
+        executor = get_save_executor()
+        sheet_futures = {}
 
         # Save individual frames and sprite sheets
         for anim_type, frames in animation_frames.items():
             # Save individual frames
             save_frames_to_disk(
                 frames,
-                pack_dir,
+                creatures_dir,
                 creature_id,
                 anim_type,
                 variant_index,
+                saved_frames=saved_frames,
             )
 
             # Create and save animation sprite sheet
             sprite_sheet = create_animation_sprite_sheet(frames, spacing=2)
-            sheet_path = save_sprite_sheet(
+            sprite_sheets[anim_type] = sprite_sheet
+            sheet_futures[anim_type.value] = executor.submit(
+                save_sprite_sheet,
                 sprite_sheet,
-                pack_dir,
+                creatures_dir,
                 creature_id,
                 anim_type,
                 variant_index,
             )
-            sprite_sheet_paths[anim_type.value] = str(sheet_path.relative_to(self.config.output_dir))
 
         # Create and save combined sprite sheet
-        combined_sheet = create_combined_sprite_sheet(animation_frames, spacing=2)
-        combined_path = save_sprite_sheet(
-            combined_sheet,
-            pack_dir,
+        if self.config.build_combined:
+            combined_sheet = create_combined_sprite_sheet(
+                animation_frames, spacing=2, animation_sheets=sprite_sheets
+            )
+            sheet_futures["combined"] = executor.submit(
+                save_sprite_sheet,
+                combined_sheet,
+                creatures_dir,
+                creature_id,
+                AnimationType.IDLE,  # Unused for combined
+                variant_index,
+                is_combined=True,
+                compress_level=PNG_MAX_COMPRESS_LEVEL,
+            )
+
+        sprite_sheet_paths = {
+            name: str(future.result().relative_to(self.config.output_dir))
+            for name, future in sheet_futures.items()
+        }
+
+        return sprite_sheet_paths, sprite_sheets
+
+    def generate_and_save_creature(
+        self,
+        creature_index: int,
+        variant_index: int = 0,
+        generation_time: Optional[str] = None,
+    ) -> tuple[CreatureMetadata, Optional["Image.Image"]]:
+        """
+        Generate, save and describe one creature variant.
+
+        Args:
+            creature_index: Index of the creature
+            variant_index: Color variant index (0 = base)
+            generation_time: Pack generation timestamp (defaults to now)
+
+        Returns:
+            Tuple of (creature metadata, idle sprite sheet for the pack preview
+            or None if this variant isn't shown in it)
+        """
+        # Generate creature
+        creature_id, animation_frames = self.generate_creature(creature_index, variant_index)
+
+        # Save assets
+        sprite_sheet_paths, sprite_sheets = self.save_creature_assets(
             creature_id,
-            AnimationType.IDLE,  # Unused for combined
+            animation_frames,
             variant_index,
-            is_combined=True,
         )
-        sprite_sheet_paths["combined"] = str(combined_path.relative_to(self.config.output_dir))
 
-        return sprite_sheet_paths
+        # Create creature metadata
+        creature_meta = create_creature_metadata(
+            creature_id=f"{creature_id}_v{variant_index}",
+            theme=self.config.theme_name,
+            base_color="#000000",  # Placeholder
+            variant_index=variant_index,
+            resolution=self.config.resolution,
+            sprite_sheet_paths=sprite_sheet_paths,
+            frames_per_animation=self.config.frames_per_animation,
+            generation_time=generation_time,
+        )
+
+        # Keep the in-memory idle sheet of the first base creatures for the
+        # preview rather than decoding the saved PNG later
+        preview_sheet = None
+        if variant_index == 0 and creature_index < MAX_PREVIEW_SHEETS:
+            preview_sheet = sprite_sheets.get(AnimationType.IDLE)
+
+        return creature_meta, preview_sheet
+
+    def _run_creature_jobs(
+        self,
+        jobs: List[tuple[int, int]],
+        generation_time: Optional[str] = None,
+    ) -> Iterator[tuple[int, int, CreatureMetadata, Optional["Image.Image"]]]:
+        """
+        Run creature jobs serially or across worker processes.
+
+        Creatures write to disjoint directories, so workers never contend for
+        files. With workers, results are yielded as they complete.
+
+        Args:
+            jobs: List of (creature_index, variant_index) pairs
+            generation_time: Timestamp recorded on every creature
+
+        Yields:
+            Tuples of (creature_index, variant_index, creature metadata,
+            preview sheet or None)
+        """
+        workers = self.config.num_workers or os.cpu_count() or 1
+        if workers <= 1 or len(jobs) <= 1:
+            for idx, variant in jobs:
+                creature_meta, preview_sheet = self.generate_and_save_creature(
+                    idx, variant, generation_time
+                )
+                yield idx, variant, creature_meta, preview_sheet
+            return
+
+        from pixel_factory.spritesheet import get_process_context
+
+        logger.info(f"Generating {len(jobs)} creature variants with {workers} workers")
+
+        # Each worker builds its own pipeline once, so jobs only carry indices
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=get_process_context(),
+            initializer=_init_creature_worker,
+            initargs=(self.config, self.generator, self.theme_config),
+        ) as executor:
+            futures = {
+                executor.submit(_creature_worker, idx, variant, generation_time): (idx, variant)
+                for idx, variant in jobs
+            }
+            for future in as_completed(futures):
+                yield (*futures[future], *future.result())
 
     def generate_pack(self) -> PackMetadata:
         """
@@ -153,6 +289,8 @@ class CreaturePackPipeline:
         Returns:
             PackMetadata for the generated pack
         """
+        from pixel_factory.preview import create_pack_preview
+
         logger.info(f"Starting pack generation: {self.config.pack_name}")
         logger.info(f"Theme: {self.config.theme_name}, Resolution: {self.config.resolution}")
         logger.info(f"Creatures: {self.config.num_creatures}, Variants: {self.config.num_variants}")
@@ -167,55 +305,39 @@ class CreaturePackPipeline:
             num_variants=self.config.num_variants,
         )
 
-        # Generate creatures
-        all_sprite_sheets = []
+        # Generate creatures, one job per (creature, variant)
+        jobs = [
+            (creature_idx, variant_idx)
+            for creature_idx in range(self.config.num_creatures)
+            for variant_idx in range(self.config.num_variants)
+        ]
+        preview_sheets: dict[int, "Image.Image"] = {}
 
-        for creature_idx in range(self.config.num_creatures):
-            for variant_idx in range(self.config.num_variants):
-                # Generate creature
-                creature_id, animation_frames = self.generate_creature(creature_idx, variant_idx)
+        # Each job fills its own slot, so metadata keeps creature/variant
+        # order even when workers finish out of order
+        num_variants = self.config.num_variants
+        creatures: List[Optional[CreatureMetadata]] = [None] * len(jobs)
 
-                # Save assets
-                sprite_sheet_paths = self.save_creature_assets(
-                    creature_id,
-                    animation_frames,
-                    variant_idx,
-                )
+        # All creatures share the pack's timestamp
+        results = self._run_creature_jobs(jobs, generation_time=pack_metadata.generation_date)
 
-                # Create creature metadata
-                creature_meta = create_creature_metadata(
-                    creature_id=f"{creature_id}_v{variant_idx}",
-                    theme=self.config.theme_name,
-                    base_color="#000000",  # Placeholder
-                    variant_index=variant_idx,
-                    resolution=self.config.resolution,
-                    sprite_sheet_paths=sprite_sheet_paths,
-                    frames_per_animation=self.config.frames_per_animation,
-                )
-                pack_metadata.creatures.append(creature_meta)
-
-                # Collect combined sprite sheet for preview (base variants only)
-                if variant_idx == 0:
-                    combined_path = (
-                        self.config.output_dir
-                        / self.config.pack_name
-                        / "creatures"
-                        / creature_id
-                        / "sprite_sheets"
-                        / "idle.png"
-                    )
-                    if combined_path.exists():
-                        all_sprite_sheets.append(Image.open(combined_path))
+        for creature_idx, variant_idx, creature_meta, preview_sheet in results:
+            creatures[creature_idx * num_variants + variant_idx] = creature_meta
+            if preview_sheet is not None:
+                preview_sheets[creature_idx] = preview_sheet
+
+        pack_metadata.creatures = creatures  # type: ignore[assignment]  # every slot filled
+        all_sprite_sheets = [preview_sheets[idx] for idx in sorted(preview_sheets)]
 
         # Save metadata
-        pack_dir = self.config.output_dir / self.config.pack_name
+        pack_dir = self._pack_dir
         metadata_path = pack_dir / "metadata.json"
         save_metadata(pack_metadata, metadata_path)
         logger.info(f"Metadata saved: {metadata_path}")
 
         # Save README
         readme_path = pack_dir / "README.txt"
-        save_readme(pack_metadata, readme_path)
+        save_readme(pack_metadata, readme_path, self.config.build_combined)
         logger.info(f"README saved: {readme_path}")
 
         # Generate preview
@@ -226,7 +348,7 @@ class CreaturePackPipeline:
 
             logger.info("Generating pack preview...")
             create_pack_preview(
-                all_sprite_sheets[:20],  # Limit to 20 for preview
+                all_sprite_sheets,
                 pack_metadata,
                 scale=8,
                 output_path=preview_path,
@@ -251,13 +373,41 @@ class CreaturePackPipeline:
         pack_metadata = self.generate_pack()
 
         # Export
-        pack_dir = self.config.output_dir / self.config.pack_name
+        pack_dir = self._pack_dir
         export_info = export_pack(
             pack_dir,
             self.config.output_dir,
             pack_metadata,
             create_archive=create_archive,
             cleanup=cleanup,
+            compression=self.config.archive_compression,
         )
 
         return export_info
+
+
+# Pipeline reused by every job of a worker process, see _init_creature_worker
+_worker_pipeline: Optional[CreaturePackPipeline] = None
+
+
+def _init_creature_worker(
+    config: GenerationConfig,
+    generator: "PixelArtGenerator",
+    theme_config: ThemeConfig,
+) -> None:
+    """Build the pipeline for a worker process once, before its first job."""
+    global _worker_pipeline
+    _worker_pipeline = CreaturePackPipeline(config, generator, theme_config)
+
+
+def _creature_worker(
+    creature_index: int,
+    variant_index: int,
+    generation_time: Optional[str],
+) -> tuple[CreatureMetadata, Optional["Image.Image"]]:
+    """Generate and save one creature variant with the worker's pipeline."""
+    if _worker_pipeline is None:
+        raise RuntimeError("Creature worker used without _init_creature_worker")
+    return _worker_pipeline.generate_and_save_creature(
+        creature_index, variant_index, generation_time
+    )
@@ -2,13 +2,40 @@
 Preview image generation for asset packs.
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from PIL import Image, ImageDraw, ImageFont
 
 from pixel_factory.models import PackMetadata
-from pixel_factory.spritesheet import create_grid_layout, upscale_nearest_neighbor
+from pixel_factory.spritesheet import (
+    create_grid_layout,
+    to_palette_image,
+    upscale_nearest_neighbor,
+)
+
+_TITLE_FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+_INFO_FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
+
+@lru_cache(maxsize=32)
+def _load_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font once per (path, size); raises OSError if missing."""
+    return ImageFont.truetype(path, size)
+
+
+@lru_cache(maxsize=1)
+def _default_font() -> Union[ImageFont.FreeTypeFont, ImageFont.ImageFont]:
+    """Load Pillow's built-in font once, for when the TrueType fonts are missing."""
+    return ImageFont.load_default()
+
+
+@lru_cache(maxsize=128)
+def _text_width(text: str, font: Union[ImageFont.FreeTypeFont, ImageFont.ImageFont]) -> int:
+    """Measure rendered text width; both font loaders cache, so the key stays stable."""
+    left, _, right, _ = font.getbbox(text)
+    return int(right - left)
 
 
 def create_pack_preview(
@@ -40,15 +67,14 @@ def create_pack_preview(
         # Extract first frame (assume horizontal sprite sheet)
         frame_height = sheet.height
         frame_width = frame_height  # Assuming square frames
-        first_frame = sheet.crop((0, 0, frame_width, frame_height))
-        # Upscale with nearest neighbor to preserve pixel art
-        upscaled = upscale_nearest_neighbor(first_frame, scale)
-        preview_sprites.append(upscaled)
+        preview_sprites.append(sheet.crop((0, 0, frame_width, frame_height)))
 
-    # Create grid
-    spacing = 8 * scale
+    # Lay out the grid at native size and upscale it once with nearest
+    # neighbor; every offset scales by the same integer factor, so this
+    # matches upscaling each sprite and spacing them by 8 * scale
     bg_color = (26, 26, 26, 255)
-    grid = create_grid_layout(preview_sprites, cols=cols, spacing=spacing, background_color=bg_color)
+    grid = create_grid_layout(preview_sprites, cols=cols, spacing=8, background_color=bg_color)
+    grid = upscale_nearest_neighbor(grid, scale)
 
     # Add header with pack info
     header_height = 80 * scale
@@ -60,16 +86,15 @@ def create_pack_preview(
 
     # Try to use a default font, fall back to default if not available
     try:
-        title_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 24 * scale // 4)
-        info_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 16 * scale // 4)
+        title_font = _load_font(_TITLE_FONT_PATH, 24 * scale // 4)
+        info_font = _load_font(_INFO_FONT_PATH, 16 * scale // 4)
     except (OSError, IOError):
-        title_font = ImageFont.load_default()
-        info_font = ImageFont.load_default()
+        title_font = _default_font()
+        info_font = _default_font()
 
     # Draw title
     title = f"{pack_metadata.pack_name}"
-    title_bbox = draw.textbbox((0, 0), title, font=title_font)
-    title_width = title_bbox[2] - title_bbox[0]
+    title_width = _text_width(title, title_font)
     title_x = (final_width - title_width) // 2
     draw.text((title_x, 10 * scale), title, fill=(255, 255, 255, 255), font=title_font)
 
@@ -80,8 +105,7 @@ def create_pack_preview(
         f"{pack_metadata.num_variants} Variants | "
         f"{pack_metadata.resolution[0]}x{pack_metadata.resolution[1]}"
     )
-    info_bbox = draw.textbbox((0, 0), info_text, font=info_font)
-    info_width = info_bbox[2] - info_bbox[0]
+    info_width = _text_width(info_text, info_font)
     info_x = (final_width - info_width) // 2
     draw.text((info_x, 40 * scale), info_text, fill=(200, 200, 200, 255), font=info_font)
 
@@ -89,11 +113,24 @@ def create_pack_preview(
     preview.paste(grid, (0, header_height), grid)
 
     if output_path:
-        preview.save(output_path, "PNG")
+        _to_preview_palette(preview).save(output_path, "PNG")
 
     return preview
 
 
+def _to_preview_palette(preview: Image.Image) -> Image.Image:
+    """
+    Reduce a preview to at most 256 colors for a smaller, faster PNG.
+
+    Previews with few enough colors are palettized losslessly; otherwise
+    they are quantized, which is fine for an image only meant to be viewed.
+    """
+    palettized = to_palette_image(preview)
+    if palettized.mode == "P":
+        return palettized
+    return preview.quantize(colors=256, method=Image.Quantize.FASTOCTREE, kmeans=0)
+
+
 def create_creature_showcase(
     creature_dir: Path,
     output_path: Path,
@@ -112,31 +149,37 @@ def create_creature_showcase(
     """
     sprite_sheets_dir = creature_dir / "sprite_sheets"
 
-    # Load sprite sheets
-    sprite_sheets = []
+    # Opening only reads the PNG headers, which is enough to size the canvas
+    sheet_files = []
+    sheet_sizes = []
     for sheet_file in sorted(sprite_sheets_dir.glob("*.png")):
         if "combined" not in sheet_file.name and "variant" not in sheet_file.name:
-            sprite_sheets.append(Image.open(sheet_file))
+            with Image.open(sheet_file) as sheet:
+                sheet_sizes.append(sheet.size)
+            sheet_files.append(sheet_file)
 
-    if not sprite_sheets:
+    if not sheet_files:
         raise ValueError(f"No sprite sheets found in {sprite_sheets_dir}")
 
-    # Upscale and stack
-    upscaled_sheets = [upscale_nearest_neighbor(sheet, scale) for sheet in sprite_sheets]
-
     # Calculate dimensions
-    max_width = max(sheet.width for sheet in upscaled_sheets)
-    total_height = sum(sheet.height for sheet in upscaled_sheets)
+    max_width = max(width for width, _ in sheet_sizes) * scale
+    total_height = sum(height for _, height in sheet_sizes) * scale
     spacing = 4 * scale
-    total_height += spacing * (len(upscaled_sheets) - 1)
+    total_height += spacing * (len(sheet_files) - 1)
 
     # Create showcase
     showcase = Image.new("RGBA", (max_width, total_height), (26, 26, 26, 255))
 
+    # Decode, upscale and paste one sheet at a time to bound memory
     y_offset = 0
-    for sheet in upscaled_sheets:
-        showcase.paste(sheet, (0, y_offset), sheet)
-        y_offset += sheet.height + spacing
+    for sheet_file in sheet_files:
+        with Image.open(sheet_file) as sheet:
+            # Saved sheets are palette images; pasting needs an RGBA mask
+            upscaled = upscale_nearest_neighbor(sheet.convert("RGBA"), scale)
+        showcase.paste(upscaled, (0, y_offset), upscaled)
+        y_offset += upscaled.height + spacing
+        # Free this sheet before the next one is decoded and upscaled
+        del upscaled
 
     showcase.save(output_path, "PNG")
     return showcase
@@ -2,13 +2,43 @@
 Sprite sheet composition and color variant generation.
 """
 
+import hashlib
+import logging
+import math
+import multiprocessing
+import os
+import shutil
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.context import BaseContext
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, cast
 
+import PIL
 from PIL import Image, ImageDraw
 
 from pixel_factory.models import AnimationType
 
+logger = logging.getLogger(__name__)
+
+# zlib levels for PNG output: fast for the bulk of the frames and sheets,
+# maximum for the combined sheets that ship as the main artifact
+PNG_FAST_COMPRESS_LEVEL = 1
+PNG_MAX_COMPRESS_LEVEL = 9
+
+# Threads encoding PNGs (zlib releases the GIL while compressing)
+_SAVE_WORKERS = min(8, os.cpu_count() or 1)
+_save_pool: Optional[ThreadPoolExecutor] = None
+_save_pool_pid: Optional[int] = None
+_save_pool_lock = threading.Lock()
+
+# Pillow-SIMD releases carry a ".postN" version suffix
+PILLOW_SIMD = ".post" in PIL.__version__
+if not PILLOW_SIMD:
+    logger.debug(f"Using Pillow {PIL.__version__}; Pillow-SIMD speeds up sprite sheet paste/resize")
+
 
 def apply_color_variant(base_image: Image.Image, hue_shift: int, saturation_factor: float) -> Image.Image:
     """
@@ -22,35 +52,147 @@ def apply_color_variant(base_image: Image.Image, hue_shift: int, saturation_fact
     Returns:
         New image with transformed colors
     """
-    # Convert to HSV for color manipulation
-    rgb_image = base_image.convert("RGB")
-    hsv_image = rgb_image.convert("HSV")
-
-    # Get alpha channel separately
-    alpha = base_image.split()[3] if base_image.mode == "RGBA" else None
-
-    # Apply transformations
-    hsv_data = []
-    for h, s, v in hsv_image.getdata():
-        # Shift hue
-        new_h = (h + hue_shift) % 256
-        # Adjust saturation
-        new_s = min(255, max(0, int(s * saturation_factor)))
-        hsv_data.append((new_h, new_s, v))
-
-    hsv_image.putdata(hsv_data)
-    result = hsv_image.convert("RGB")
-
-    # Restore alpha
-    if alpha:
-        result = result.convert("RGBA")
-        result.putalpha(alpha)
+    # Rotate hue and scale saturation in one linear RGB transform
+    rgb_image = base_image if base_image.mode == "RGB" else base_image.convert("RGB")
+    result = rgb_image.convert("RGB", _variant_matrix(hue_shift, saturation_factor))
+
+    # Restore alpha; putalpha widens the RGB result to RGBA in place
+    if base_image.mode == "RGBA":
+        result.putalpha(base_image.getchannel("A"))
     else:
         result = result.convert("RGBA")
 
     return result
 
 
+def apply_color_variant_batch(
+    frames: List[Image.Image], hue_shift: int, saturation_factor: float
+) -> List[Image.Image]:
+    """
+    Apply the same color transformation to a list of frames.
+
+    Identical frames are transformed once, and same-size RGBA frames are
+    stacked into one strip so the whole batch goes through a single
+    conversion.
+
+    Args:
+        frames: Source images in RGBA mode
+        hue_shift: Degrees to shift hue (-180 to 180)
+        saturation_factor: Multiplier for saturation (0.0 to 2.0)
+
+    Returns:
+        New images with transformed colors, in the same order as frames
+    """
+    if not frames:
+        return []
+
+    size = frames[0].size
+    if any(frame.mode != "RGBA" or frame.size != size for frame in frames):
+        return [apply_color_variant(frame, hue_shift, saturation_factor) for frame in frames]
+
+    # Map each frame to the slot of its first identical frame
+    slots: Dict[bytes, int] = {}
+    unique_frames: List[Image.Image] = []
+    frame_slots = []
+    for frame in frames:
+        slot = slots.setdefault(frame.tobytes(), len(unique_frames))
+        if slot == len(unique_frames):
+            unique_frames.append(frame)
+        frame_slots.append(slot)
+
+    width, height = size
+    strip = Image.new("RGBA", (width, height * len(unique_frames)))
+    for slot, frame in enumerate(unique_frames):
+        strip.paste(frame, (0, slot * height))
+
+    strip = apply_color_variant(strip, hue_shift, saturation_factor)
+    variants = [
+        strip.crop((0, slot * height, width, (slot + 1) * height))
+        for slot in range(len(unique_frames))
+    ]
+    # Copy repeated frames so callers never share an image between slots
+    seen = set()
+    results = []
+    for slot in frame_slots:
+        results.append(variants[slot].copy() if slot in seen else variants[slot])
+        seen.add(slot)
+    return results
+
+
+# RGB <-> YIQ; Y is luma, hue and saturation are the angle and length of (I, Q)
+_RGB_TO_YIQ = (
+    (0.299, 0.587, 0.114),
+    (0.596, -0.274, -0.322),
+    (0.211, -0.523, 0.312),
+)
+_YIQ_TO_RGB = (
+    (1.0, 0.956, 0.621),
+    (1.0, -0.272, -0.647),
+    (1.0, -1.106, 1.703),
+)
+
+
+def _matmul(a: Sequence[Sequence[float]], b: Sequence[Sequence[float]]) -> List[List[float]]:
+    """Multiply two 3x3 matrices."""
+    return [[sum(a[i][k] * b[k][j] for k in range(3)) for j in range(3)] for i in range(3)]
+
+
+@lru_cache(maxsize=32)
+def _variant_matrix(hue_shift: int, saturation_factor: float) -> Tuple[float, ...]:
+    """
+    Build the color matrix for a variant, in the 12-tuple form Image.convert takes.
+
+    Rotating (I, Q) about the luma axis shifts hue while keeping brightness,
+    and scaling it adjusts saturation.
+    """
+    # Negative angle so positive shifts run red -> yellow -> green like HSV
+    theta = -math.radians(hue_shift)
+    cos_s = math.cos(theta) * saturation_factor
+    sin_s = math.sin(theta) * saturation_factor
+    chroma = ((1.0, 0.0, 0.0), (0.0, cos_s, -sin_s), (0.0, sin_s, cos_s))
+
+    matrix = _matmul(_YIQ_TO_RGB, _matmul(chroma, _RGB_TO_YIQ))
+    return tuple(value for row in matrix for value in (*row, 0.0))
+
+
+def _as_rgba(frames: Sequence[Image.Image]) -> Sequence[Image.Image]:
+    """Convert any non-RGBA frames up front so paste loops needn't check modes."""
+    if all(frame.mode == "RGBA" for frame in frames):
+        return frames
+    return [frame if frame.mode == "RGBA" else frame.convert("RGBA") for frame in frames]
+
+
+def _paste_frame(
+    sprite_sheet: Image.Image,
+    frame: Image.Image,
+    position: Tuple[int, int],
+    onto_transparent: bool = False,
+) -> None:
+    """
+    Paste a frame onto a sprite sheet, compositing only where alpha requires it.
+
+    Args:
+        sprite_sheet: RGBA sheet to paste onto
+        frame: RGBA frame image (see _as_rgba)
+        position: Top-left corner of the frame on the sheet
+        onto_transparent: Whether the target area is fully transparent, in
+            which case compositing the frame over it is just a copy
+    """
+    if onto_transparent:
+        sprite_sheet.paste(frame, position)
+        return
+
+    alpha_min, alpha_max = frame.getchannel("A").getextrema()
+    if alpha_max == 0:
+        # Fully transparent: compositing would leave the background as is
+        return
+    if alpha_min == 255:
+        # Fully opaque: a plain copy gives the same pixels as blending
+        sprite_sheet.paste(frame, position)
+    else:
+        sprite_sheet.paste(frame, position, frame)
+
+
 def create_animation_sprite_sheet(
     frames: List[Image.Image],
     spacing: int = 0,
@@ -73,11 +215,14 @@ def create_animation_sprite_sheet(
     frame_width, frame_height = frames[0].size
     total_width = len(frames) * frame_width + (len(frames) - 1) * spacing
 
+    rgba_frames = _as_rgba(frames)
     sprite_sheet = Image.new("RGBA", (total_width, frame_height), background_color)
+    # Frames never overlap, so on a transparent background each is a plain copy
+    onto_transparent = background_color[3] == 0
 
     x_offset = 0
-    for frame in frames:
-        sprite_sheet.paste(frame, (x_offset, 0), frame if frame.mode == "RGBA" else None)
+    for frame in rgba_frames:
+        _paste_frame(sprite_sheet, frame, (x_offset, 0), onto_transparent)
         x_offset += frame_width + spacing
 
     return sprite_sheet
@@ -87,6 +232,7 @@ def create_combined_sprite_sheet(
     animation_frames: dict[AnimationType, List[Image.Image]],
     spacing: int = 2,
     background_color: Tuple[int, int, int, int] = (0, 0, 0, 0),
+    animation_sheets: Optional[Dict[AnimationType, Image.Image]] = None,
 ) -> Image.Image:
     """
     Create a combined sprite sheet with all animations stacked vertically.
@@ -95,6 +241,9 @@ def create_combined_sprite_sheet(
         animation_frames: Dictionary mapping animation types to frame lists
         spacing: Pixels between rows and frames
         background_color: RGBA background color
+        animation_sheets: Optional per-animation sheets already built by
+            create_animation_sprite_sheet with the same spacing and
+            background; each is copied in as a whole row
 
     Returns:
         Combined sprite sheet with all animations
@@ -112,14 +261,21 @@ def create_combined_sprite_sheet(
     total_height = len(animation_types) * frame_height + (len(animation_types) - 1) * spacing
 
     sprite_sheet = Image.new("RGBA", (total_width, total_height), background_color)
+    onto_transparent = background_color[3] == 0
 
     y_offset = 0
     for anim_type in animation_types:
-        frames = animation_frames[anim_type]
+        if animation_sheets is not None and anim_type in animation_sheets:
+            # The row is already composited onto the same background
+            sprite_sheet.paste(animation_sheets[anim_type], (0, y_offset))
+            y_offset += frame_height + spacing
+            continue
+
+        frames = _as_rgba(animation_frames[anim_type])
         x_offset = 0
 
         for frame in frames:
-            sprite_sheet.paste(frame, (x_offset, y_offset), frame if frame.mode == "RGBA" else None)
+            _paste_frame(sprite_sheet, frame, (x_offset, y_offset), onto_transparent)
             x_offset += frame_width + spacing
 
         y_offset += frame_height + spacing
@@ -127,22 +283,105 @@ def create_combined_sprite_sheet(
     return sprite_sheet
 
 
+def get_save_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared thread pool used to encode PNGs.
+
+    The pool is recreated after a fork, since a child process doesn't
+    inherit the parent's worker threads.
+
+    Returns:
+        ThreadPoolExecutor for PNG saves
+    """
+    global _save_pool, _save_pool_pid
+    with _save_pool_lock:
+        if _save_pool is None or _save_pool_pid != os.getpid():
+            _save_pool = ThreadPoolExecutor(
+                max_workers=_SAVE_WORKERS, thread_name_prefix="png-save"
+            )
+            _save_pool_pid = os.getpid()
+        return _save_pool
+
+
+def get_process_context() -> Optional[BaseContext]:
+    """
+    Get the multiprocessing context for the process pools that render frames.
+
+    Forking a process that has loaded PIL is unreliable on macOS, so pools
+    spawn their workers there and use the platform default elsewhere.
+
+    Returns:
+        Spawn context on macOS, otherwise None for the default context
+    """
+    return multiprocessing.get_context("spawn") if sys.platform == "darwin" else None
+
+
+def to_palette_image(image: Image.Image) -> Image.Image:
+    """
+    Convert an image into its most compact form for saving.
+
+    Images with at most 256 distinct RGBA colors are losslessly converted
+    to palette mode with per-entry alpha; anything else is returned as is.
+    Call this only right before saving, since compositing expects RGBA.
+
+    Args:
+        image: Finished RGBA image
+
+    Returns:
+        Palette image, or the original image if it can't be palettized exactly
+    """
+    colors = image.getcolors(256)
+    if image.mode != "RGBA" or colors is None:
+        return image
+
+    # getcolors() types pixels as tuple | float; RGBA pixels are 4-tuples
+    rgba_colors = [cast(Tuple[int, int, int, int], color) for _, color in colors]
+    # Pixels are mapped by RGB, so each RGB value needs a single alpha
+    if len({color[:3] for color in rgba_colors}) != len(rgba_colors):
+        return image
+
+    palette = Image.new("P", (1, 1))
+    palette.putpalette([value for color in rgba_colors for value in color[:3]])
+
+    # Pillow matches palette entries through a reduced-precision color cache,
+    # so nearly identical colors can share an entry. The match depends only
+    # on the color, so mapping each palette color once checks every pixel.
+    swatch = Image.new("RGB", (len(rgba_colors), 1))
+    swatch.putdata([color[:3] for color in rgba_colors])
+    indices = swatch.quantize(palette=palette, dither=Image.Dither.NONE)
+    if indices.tobytes() != bytes(range(len(rgba_colors))):
+        return image
+
+    result = image.convert("RGB").quantize(palette=palette, dither=Image.Dither.NONE)
+    result.putpalette([value for color in rgba_colors for value in color], "RGBA")
+    return result
+
+
 def save_frames_to_disk(
     frames: List[Image.Image],
     output_dir: Path,
     creature_id: str,
     animation_type: AnimationType,
     variant_index: int = 0,
+    saved_frames: Optional[Dict[bytes, str]] = None,
+    compress_level: int = PNG_FAST_COMPRESS_LEVEL,
 ) -> List[Path]:
     """
     Save animation frames to disk.
 
+    Frames are saved as palette PNGs when that is lossless. Frames whose
+    pixels match an already saved frame are hard-linked (or copied) to that
+    file instead of being encoded again.
+
     Args:
         frames: List of frame images
         output_dir: Base output directory
         creature_id: Identifier for the creature
         animation_type: Type of animation
         variant_index: Color variant index
+        saved_frames: Optional map of frame content hash to saved path, shared
+            across calls to deduplicate frames between animations
+        compress_level: zlib level for the PNG encoder (0-9)
 
     Returns:
         List of paths to saved files
@@ -151,18 +390,61 @@ def save_frames_to_disk(
     creature_dir = output_dir / creature_id / animation_type.value
     creature_dir.mkdir(parents=True, exist_ok=True)
 
+    if saved_frames is None:
+        saved_frames = {}
+
+    # Build file names as plain strings; this loop runs for every frame
+    base = os.fspath(creature_dir) + os.sep
+    suffix = f"_variant_{variant_index}.png" if variant_index > 0 else ".png"
+
     saved_paths = []
+    to_encode = []
+    to_link = []
     for i, frame in enumerate(frames, 1):
-        if variant_index > 0:
-            filename = f"frame_{i:02d}_variant_{variant_index}.png"
+        frame_path = f"{base}frame_{i:02d}{suffix}"
+        # Never write through a hard link left by a previous run
+        try:
+            os.unlink(frame_path)
+        except FileNotFoundError:
+            pass
+
+        frame = to_palette_image(frame)
+        key = _frame_key(frame)
+        existing = saved_frames.get(key)
+        if existing is not None:
+            to_link.append((existing, frame_path))
         else:
-            filename = f"frame_{i:02d}.png"
-
-        frame_path = creature_dir / filename
-        frame.save(frame_path, "PNG")
+            to_encode.append((frame, frame_path))
+            saved_frames[key] = frame_path
         saved_paths.append(frame_path)
 
-    return saved_paths
+    # Encode the unique frames concurrently, then link duplicates to them
+    def encode(job: Tuple[Image.Image, str]) -> None:
+        job[0].save(job[1], "PNG", compress_level=compress_level, optimize=False)
+
+    list(get_save_executor().map(encode, to_encode))
+    for source, target in to_link:
+        _link_or_copy(source, target)
+
+    return [Path(path) for path in saved_paths]
+
+
+def _frame_key(frame: Image.Image) -> bytes:
+    """Hash a frame's mode, size, palette and pixels for duplicate detection."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{frame.mode}:{frame.width}x{frame.height}".encode())
+    if frame.palette is not None:
+        digest.update(frame.palette.tobytes())
+    digest.update(frame.tobytes())
+    return digest.digest()
+
+
+def _link_or_copy(source: str, target: str) -> None:
+    """Hard-link ``target`` to ``source``, copying if links are unsupported."""
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
 
 
 def save_sprite_sheet(
@@ -172,9 +454,10 @@ def save_sprite_sheet(
     animation_type: AnimationType,
     variant_index: int = 0,
     is_combined: bool = False,
+    compress_level: int = PNG_FAST_COMPRESS_LEVEL,
 ) -> Path:
     """
-    Save sprite sheet to disk.
+    Save sprite sheet to disk, as a palette PNG when that is lossless.
 
     Args:
         sprite_sheet: Sprite sheet image
@@ -183,6 +466,7 @@ def save_sprite_sheet(
         animation_type: Type of animation (ignored if is_combined=True)
         variant_index: Color variant index
         is_combined: Whether this is a combined sprite sheet
+        compress_level: zlib level for the PNG encoder (0-9)
 
     Returns:
         Path to saved file
@@ -202,7 +486,9 @@ def save_sprite_sheet(
             filename = f"{animation_type.value}.png"
 
     sheet_path = sheets_dir / filename
-    sprite_sheet.save(sheet_path, "PNG")
+    to_palette_image(sprite_sheet).save(
+        sheet_path, "PNG", compress_level=compress_level, optimize=False
+    )
     return sheet_path
 
 
@@ -217,8 +503,13 @@ def upscale_nearest_neighbor(image: Image.Image, scale: int) -> Image.Image:
     Returns:
         Upscaled image
     """
+    if scale == 1:
+        return image.copy()
+
+    # Pillow's NEAREST resize is already a C-level strided copy; for integer
+    # scales every source pixel maps to an exact scale x scale block
     new_size = (image.width * scale, image.height * scale)
-    return image.resize(new_size, Image.NEAREST)
+    return image.resize(new_size, Image.Resampling.NEAREST)
 
 
 def create_grid_layout(
@@ -250,11 +541,12 @@ def create_grid_layout(
 
     grid = Image.new("RGBA", (total_width, total_height), background_color)
 
-    for idx, img in enumerate(images):
-        row = idx // cols
-        col = idx % cols
-        x = spacing + col * (img_width + spacing)
-        y = spacing + row * (img_height + spacing)
-        grid.paste(img, (x, y), img if img.mode == "RGBA" else None)
+    # Cell origins only depend on the grid shape
+    xs = [spacing + col * (img_width + spacing) for col in range(cols)]
+    ys = [spacing + row * (img_height + spacing) for row in range(rows)]
+
+    for idx, img in enumerate(_as_rgba(images)):
+        row, col = divmod(idx, cols)
+        _paste_frame(grid, img, (xs[col], ys[row]))
 
     return grid
@@ -0,0 +1,102 @@
+"""Tests for configuration management."""
+
+import os
+
+import pytest
+
+from pixel_factory.config import Config
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Create a test config file."""
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        "defaults:\n"
+        "  theme: test_theme\n"
+        "  num_creatures: 3\n"
+        "themes:\n"
+        "  test_theme:\n"
+        "    base_description: test creature\n"
+        "    mood_adjectives: [happy]\n"
+        "    color_palette_hints: [red and blue]\n"
+    )
+    return path
+
+
+def test_load_config_file(config_file):
+    """Test loading defaults and themes from a config file."""
+    config = Config(config_file)
+
+    assert config.default_theme == "test_theme"
+    assert config.default_num_creatures == 3
+    assert config.get_theme("test_theme").base_description == "test creature"
+    assert "cute_forest" in config.themes
+
+
+def test_load_config_file_detects_changes(config_file):
+    """Test that an edited config file is re-read instead of served from cache."""
+    assert Config(config_file).default_num_creatures == 3
+
+    stat = config_file.stat()
+    config_file.write_text(config_file.read_text().replace("num_creatures: 3", "num_creatures: 7"))
+    os.utime(config_file, (stat.st_atime, stat.st_mtime + 10))
+
+    assert Config(config_file).default_num_creatures == 7
+
+
+def test_load_config_file_writes_json_sidecar(config_file):
+    """Test that parsing a config file leaves a JSON sidecar next to it."""
+    Config(config_file)
+
+    cache_path = config_file.with_suffix(".yaml.cache.json")
+    assert cache_path.exists()
+    assert '"test_theme"' in cache_path.read_text()
+
+
+def test_load_config_file_ignores_sidecar_of_other_version(config_file):
+    """Test that restoring an older file with its mtime preserved is re-parsed."""
+    Config(config_file)
+
+    stat = config_file.stat()
+    config_file.write_text(config_file.read_text().replace("num_creatures: 3", "num_creatures: 12"))
+    os.utime(config_file, (stat.st_atime, stat.st_mtime - 100))
+
+    assert Config(config_file).default_num_creatures == 12
+
+
+def test_load_config_file_ignores_malformed_sidecar(config_file):
+    """Test that a sidecar that isn't a JSON object falls back to the YAML."""
+    from pixel_factory import config as config_module
+
+    config_file.with_suffix(".yaml.cache.json").write_text("[1, 2]")
+    config_module._YAML_CACHE.clear()
+
+    assert Config(config_file).default_num_creatures == 3
+
+
+def test_get_config_reuses_instance(config_file):
+    """Test that the global config is parsed once and shared by pipelines."""
+    from pixel_factory import config as config_module
+    from pixel_factory.models import GenerationConfig
+    from pixel_factory.pipeline import CreaturePackPipeline
+
+    config_module._config = None
+    try:
+        app_config = config_module.get_config(config_file)
+        assert config_module.get_config(config_file) is app_config
+        assert config_module.get_config() is app_config
+
+        gen_config = GenerationConfig(
+            pack_name="p",
+            theme_name="test_theme",
+            resolution=(16, 16),
+            num_creatures=1,
+            num_variants=1,
+            output_dir=config_file.parent,
+        )
+        pipelines = [CreaturePackPipeline(gen_config) for _ in range(3)]
+        assert all(p.theme_config is app_config.get_theme("test_theme") for p in pipelines)
+    finally:
+        config_module._config = None
+        config_module._config_key = None
@@ -94,3 +94,48 @@ def test_animation_variations(test_theme):
 
     # All should be valid images
     assert all(isinstance(img, Image.Image) for img in [idle, walk, attack])
+
+
+def test_repeated_pose_returns_independent_images(test_theme):
+    """Test that frames sharing a pose are equal but not the same object."""
+    generator = PlaceholderGenerator((32, 32))
+
+    first = generator.generate_single_creature(test_theme, 0, AnimationType.WALK, 0)
+    second = generator.generate_single_creature(test_theme, 0, AnimationType.WALK, 2)
+
+    assert first.tobytes() == second.tobytes()
+    assert first is not second
+
+
+def test_generate_batch_matches_serial(test_theme):
+    """Test that batched generation across processes matches serial output."""
+    generator = PlaceholderGenerator((32, 32))
+    jobs = [(i, anim, f) for i in range(3) for anim in AnimationType for f in range(2)]
+
+    batched = generator.generate_batch(test_theme, jobs, max_workers=2)
+    serial = generator.generate_batch(test_theme, jobs, max_workers=1)
+
+    assert len(batched) == len(jobs)
+    assert [img.tobytes() for img in batched] == [img.tobytes() for img in serial]
+
+
+def test_finalize_is_lossless(test_theme):
+    """Test that finalize palettizes frames without changing their pixels."""
+    generator = PlaceholderGenerator((32, 32))
+    image = generator.generate_single_creature(test_theme, 0, AnimationType.IDLE, 0)
+
+    finalized = generator.finalize(image)
+
+    assert finalized.mode == "P"
+    assert finalized.convert("RGBA").tobytes() == image.tobytes()
+
+
+def test_creature_colors_are_stable(test_theme):
+    """Test that creature colors don't depend on the interpreter's hash seed."""
+    generator = PlaceholderGenerator((32, 32))
+
+    colors = [generator._get_creature_colors(test_theme, i) for i in range(5)]
+
+    # Consecutive creatures cycle through every scheme of the theme
+    assert len(set(colors)) == 5
+    assert generator._get_creature_colors(test_theme, 5) == colors[0]
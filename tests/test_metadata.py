@@ -134,3 +134,103 @@ def test_metadata_json_format(tmp_path):
 
     assert data["pack_id"] == "test_pack"
     assert isinstance(data["resolution"], list)
+
+
+def test_saved_metadata_matches_to_dict(tmp_path):
+    """Test that the saved JSON has the same content as to_dict()."""
+    metadata = create_pack_metadata(
+        pack_id="test_pack",
+        pack_name="Test Pack",
+        theme_name="test_theme",
+        resolution=(32, 32),
+        num_creatures=1,
+        num_variants=1,
+    )
+    metadata.creatures.append(
+        create_creature_metadata(
+            creature_id="creature_001",
+            theme="test_theme",
+            base_color="#ff0000",
+            variant_index=0,
+            resolution=(32, 32),
+            sprite_sheet_paths={"idle": "test.png"},
+        )
+    )
+
+    output_path = tmp_path / "metadata.json"
+    save_metadata(metadata, output_path)
+
+    with open(output_path, "r") as f:
+        assert json.load(f) == metadata.to_dict()
+
+
+def test_generate_readme_fills_all_placeholders():
+    """Test that README placeholders in code examples are filled in."""
+    metadata = create_pack_metadata(
+        pack_id="test_pack",
+        pack_name="Test Pack",
+        theme_name="cute_forest",
+        resolution=(32, 48),
+        num_creatures=10,
+        num_variants=2,
+    )
+
+    readme = generate_readme(metadata)
+
+    assert "Test Pack/" in readme
+    assert "frame_width = 32" in readme
+    assert "frame_height = 48" in readme
+    assert "{pack_name}" not in readme
+    assert "{pack_metadata" not in readme
+
+
+def test_create_creature_metadata_animations_not_shared():
+    """Test that each creature gets its own animations mapping."""
+    first = create_creature_metadata("a", "test", "#000000", 0, (32, 32), {})
+    second = create_creature_metadata("b", "test", "#000000", 0, (32, 32), {})
+
+    first.animations["idle"] = 99
+    assert second.animations["idle"] == 4
+
+
+def test_load_metadata_interns_repeated_strings(tmp_path):
+    """Test that loaded creatures share their repeated theme and color strings."""
+    metadata = create_pack_metadata("test_pack", "Test Pack", "test_theme", (32, 32), 2, 1)
+    for idx in range(2):
+        metadata.creatures.append(
+            create_creature_metadata(f"creature_{idx}", "test_theme", "#ff0000", 0, (32, 32), {})
+        )
+    output_path = tmp_path / "metadata.json"
+    save_metadata(metadata, output_path)
+
+    first, second = load_metadata(output_path).creatures
+    assert first.theme is second.theme
+    assert first.base_color is second.base_color
+
+
+def test_generate_readme_without_combined_sheets():
+    """Test that the README only mentions combined sheets when they are built."""
+    metadata = create_pack_metadata("test_pack", "Test Pack", "cute_forest", (32, 32), 1, 1)
+
+    assert "combined.png" in generate_readme(metadata)
+    readme = generate_readme(metadata, build_combined=False)
+
+    assert "combined" not in readme
+    assert "└── attack.png" in readme
+    assert "pygame.image.load('idle.png')" in readme
+
+
+def test_load_metadata_ignores_unknown_creature_keys(tmp_path):
+    """Test that extra keys in a hand-edited metadata.json are ignored."""
+    metadata = create_pack_metadata("test_pack", "Test Pack", "test_theme", (32, 32), 1, 1)
+    metadata.creatures.append(
+        create_creature_metadata("creature_0", "test_theme", "#ff0000", 0, (32, 32), {})
+    )
+    data = metadata.to_dict()
+    data["creatures"][0]["notes"] = "added by hand"
+    output_path = tmp_path / "metadata.json"
+    output_path.write_text(json.dumps(data))
+
+    (creature,) = load_metadata(output_path).creatures
+    assert creature.creature_id == "creature_0"
+    assert creature.resolution == (32, 32)
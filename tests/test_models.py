@@ -104,3 +104,19 @@ def test_generation_config_animation_types():
     assert AnimationType.IDLE in anim_types
     assert AnimationType.WALK in anim_types
     assert AnimationType.ATTACK in anim_types
+
+
+def test_theme_config_is_frozen():
+    """Test that ThemeConfig can't be modified after creation."""
+    from dataclasses import FrozenInstanceError
+
+    theme = ThemeConfig(
+        name="test_theme",
+        description="Test theme",
+        base_description="test creature",
+        mood_adjectives=["happy"],
+        color_palette_hints=["red"],
+    )
+
+    with pytest.raises(FrozenInstanceError):
+        theme.name = "other_theme"
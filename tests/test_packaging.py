@@ -1,5 +1,6 @@
 """Tests for packaging functionality."""
 
+import shutil
 import zipfile
 from pathlib import Path
 
@@ -112,3 +113,34 @@ def test_create_pack_archive_default_path(test_pack_dir):
 
     # Cleanup
     created_path.unlink()
+
+
+def test_create_pack_archive_compression_per_file(test_pack_dir, tmp_path):
+    """Test that PNGs are stored and other files deflated by default."""
+    created_path = create_pack_archive(test_pack_dir, tmp_path / "test_pack.zip")
+
+    with zipfile.ZipFile(created_path, "r") as zipf:
+        for info in zipf.infolist():
+            if info.filename.endswith(".png"):
+                assert info.compress_type == zipfile.ZIP_STORED
+            else:
+                assert info.compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_create_pack_archive_stores_uppercase_png(test_pack_dir, tmp_path):
+    """Test that the stored-format check ignores the suffix case."""
+    (test_pack_dir / "previews").mkdir(exist_ok=True)
+    (test_pack_dir / "previews" / "extra.PNG").write_bytes(b"\x89PNG fake")
+
+    created_path = create_pack_archive(test_pack_dir, tmp_path / "test_pack.zip")
+
+    with zipfile.ZipFile(created_path, "r") as zipf:
+        info = zipf.getinfo("test_pack/previews/extra.PNG")
+        assert info.compress_type == zipfile.ZIP_STORED
+
+
+def test_validate_pack_structure_missing_subdirectory(test_pack_dir):
+    """Test validation fails when a creature lacks an animation directory."""
+    shutil.rmtree(test_pack_dir / "creatures" / "creature_001" / "walk")
+
+    assert validate_pack_structure(test_pack_dir) is False
@@ -0,0 +1,80 @@
+"""Tests for the generation pipeline."""
+
+import pytest
+from PIL import Image
+
+from pixel_factory.models import GenerationConfig
+from pixel_factory.pipeline import CreaturePackPipeline
+
+
+@pytest.fixture
+def gen_config(tmp_path):
+    """Create a small generation config."""
+    return GenerationConfig(
+        pack_name="test_pack",
+        theme_name="cute_forest",
+        resolution=(16, 16),
+        num_creatures=2,
+        num_variants=2,
+        output_dir=tmp_path,
+    )
+
+
+def test_generate_pack(gen_config):
+    """Test generating a complete pack on disk."""
+    pack_metadata = CreaturePackPipeline(gen_config).generate_pack()
+
+    pack_dir = gen_config.output_dir / gen_config.pack_name
+    assert len(pack_metadata.creatures) == 4
+    assert (pack_dir / "metadata.json").exists()
+    assert (pack_dir / "README.txt").exists()
+    assert (pack_dir / "previews" / "pack_preview.png").exists()
+
+    for creature in pack_metadata.creatures:
+        for sheet_path in creature.sprite_sheet_paths.values():
+            assert (gen_config.output_dir / sheet_path).exists()
+
+
+def test_save_creature_assets_returns_sheets(gen_config):
+    """Test that saved sprite sheets are also returned in memory."""
+    pipeline = CreaturePackPipeline(gen_config)
+    creature_id, animation_frames = pipeline.generate_creature(0)
+
+    sprite_sheet_paths, sprite_sheets = pipeline.save_creature_assets(creature_id, animation_frames)
+
+    assert set(sprite_sheets) == set(animation_frames)
+    for anim_type, sheet in sprite_sheets.items():
+        saved = Image.open(gen_config.output_dir / sprite_sheet_paths[anim_type.value])
+        assert saved.convert("RGBA").tobytes() == sheet.tobytes()
+
+
+def test_generate_pack_with_workers(gen_config):
+    """Test that parallel generation matches the serial pack layout."""
+    gen_config.num_workers = 2
+    pack_metadata = CreaturePackPipeline(gen_config).generate_pack()
+
+    creature_ids = [creature.creature_id for creature in pack_metadata.creatures]
+    assert creature_ids == sorted(creature_ids)
+    assert len(creature_ids) == 4
+    pack_dir = gen_config.output_dir / gen_config.pack_name
+    assert (pack_dir / "previews" / "pack_preview.png").exists()
+
+
+def test_generate_pack_shares_generation_time(gen_config):
+    """Test that every creature records the pack's generation timestamp."""
+    pack_metadata = CreaturePackPipeline(gen_config).generate_pack()
+
+    times = {creature.generation_time for creature in pack_metadata.creatures}
+    assert times == {pack_metadata.generation_date}
+
+
+def test_save_creature_assets_without_combined(gen_config):
+    """Test that the combined sheet can be skipped."""
+    gen_config.build_combined = False
+    pipeline = CreaturePackPipeline(gen_config)
+    creature_id, animation_frames = pipeline.generate_creature(0)
+
+    sprite_sheet_paths, _ = pipeline.save_creature_assets(creature_id, animation_frames)
+
+    assert "combined" not in sprite_sheet_paths
+    assert set(sprite_sheet_paths) == {anim_type.value for anim_type in animation_frames}
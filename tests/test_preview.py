@@ -0,0 +1,77 @@
+"""Tests for preview image generation."""
+
+from PIL import Image
+
+from pixel_factory import preview as preview_module
+from pixel_factory.metadata import create_pack_metadata
+from pixel_factory.models import AnimationType
+from pixel_factory.preview import create_creature_showcase, create_pack_preview
+from pixel_factory.spritesheet import save_sprite_sheet
+
+
+def test_create_pack_preview_layout():
+    """Test that preview sprites are upscaled and spaced by the scale factor."""
+    sheet = Image.new("RGBA", (16 * 4, 16), (0, 0, 0, 0))
+    sheet.paste((255, 0, 0, 255), (0, 0, 16, 16))
+    metadata = create_pack_metadata("test_pack", "Test Pack", "test_theme", (16, 16), 2, 1)
+
+    scale = 2
+    preview = create_pack_preview([sheet, sheet], metadata, scale=scale, cols=2)
+
+    header_height = 80 * scale
+    spacing = 8 * scale
+    cell = 16 * scale
+    assert preview.size == (2 * cell + 3 * spacing, header_height + cell + 2 * spacing)
+    red = (255, 0, 0, 255)
+    for x in (spacing, 2 * spacing + cell):
+        assert preview.getpixel((x, header_height + spacing)) == red
+        assert preview.getpixel((x + cell - 1, header_height + spacing + cell - 1)) == red
+    assert preview.getpixel((spacing - 1, header_height + spacing)) == (26, 26, 26, 255)
+
+
+def test_create_pack_preview_reuses_default_font(monkeypatch):
+    """Test that the fallback font is loaded once, so text widths stay cached."""
+
+    def missing_font(path, size):
+        raise OSError(path)
+
+    monkeypatch.setattr(preview_module, "_load_font", missing_font)
+    sheet = Image.new("RGBA", (16 * 4, 16), (255, 0, 0, 255))
+    metadata = create_pack_metadata("test_pack", "Test Pack", "test_theme", (16, 16), 1, 1)
+
+    preview_module._text_width.cache_clear()
+    create_pack_preview([sheet], metadata, scale=1)
+    create_pack_preview([sheet], metadata, scale=1)
+
+    assert preview_module._text_width.cache_info().hits == 2
+
+
+def test_create_pack_preview_saves_palette_png(tmp_path):
+    """Test that the saved preview is a palette PNG."""
+    sheet = Image.new("RGBA", (16 * 4, 16), (0, 200, 0, 255))
+    metadata = create_pack_metadata("test_pack", "Test Pack", "test_theme", (16, 16), 1, 1)
+    output_path = tmp_path / "preview.png"
+
+    preview = create_pack_preview([sheet], metadata, scale=1, output_path=output_path)
+
+    assert preview.mode == "RGBA"
+    with Image.open(output_path) as saved:
+        assert saved.mode == "P"
+        assert saved.size == preview.size
+
+
+def test_create_creature_showcase_from_saved_sheets(tmp_path):
+    """Test that saved (palette) sheets are stacked into a showcase."""
+    idle = Image.new("RGBA", (20, 4), (255, 0, 0, 255))
+    walk = Image.new("RGBA", (12, 4), (0, 255, 0, 255))
+    save_sprite_sheet(idle, tmp_path, "creature_001", AnimationType.IDLE)
+    save_sprite_sheet(walk, tmp_path, "creature_001", AnimationType.WALK)
+    save_sprite_sheet(walk, tmp_path, "creature_001", AnimationType.WALK, variant_index=1)
+
+    scale = 2
+    showcase = create_creature_showcase(tmp_path / "creature_001", tmp_path / "showcase.png", scale)
+
+    assert showcase.size == (20 * scale, 2 * 4 * scale + 4 * scale)
+    assert showcase.getpixel((0, 0)) == (255, 0, 0, 255)
+    assert showcase.getpixel((0, showcase.height - 1)) == (0, 255, 0, 255)
+    assert (tmp_path / "showcase.png").exists()
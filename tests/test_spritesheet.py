@@ -6,9 +6,12 @@ from PIL import Image
 from pixel_factory.models import AnimationType
 from pixel_factory.spritesheet import (
     apply_color_variant,
+    apply_color_variant_batch,
     create_animation_sprite_sheet,
     create_combined_sprite_sheet,
     create_grid_layout,
+    save_frames_to_disk,
+    to_palette_image,
     upscale_nearest_neighbor,
 )
 
@@ -64,6 +67,47 @@ def test_create_combined_sprite_sheet(test_frames):
     assert combined.size == (134, 100)
 
 
+def test_create_animation_sprite_sheet_keeps_partial_alpha():
+    """Test that frames on a transparent background are copied unchanged."""
+    frame = Image.new("RGBA", (2, 2), (100, 150, 200, 128))
+
+    sheet = create_animation_sprite_sheet([frame, frame], spacing=0)
+
+    assert sheet.tobytes() == Image.new("RGBA", (4, 2), (100, 150, 200, 128)).tobytes()
+
+
+def test_create_combined_sprite_sheet_from_animation_sheets(test_frames):
+    """Test that prebuilt animation sheets produce the same combined sheet."""
+    animation_frames = {
+        AnimationType.IDLE: test_frames,
+        AnimationType.WALK: test_frames[:3],
+        AnimationType.ATTACK: test_frames,
+    }
+    animation_sheets = {
+        anim_type: create_animation_sprite_sheet(frames, spacing=2)
+        for anim_type, frames in animation_frames.items()
+    }
+
+    combined = create_combined_sprite_sheet(
+        animation_frames, spacing=2, animation_sheets=animation_sheets
+    )
+
+    assert combined.tobytes() == create_combined_sprite_sheet(animation_frames, spacing=2).tobytes()
+
+
+def test_create_animation_sprite_sheet_alpha_handling():
+    """Test that opaque frames are copied and transparent ones composited."""
+    opaque = Image.new("RGBA", (2, 2), (10, 20, 30, 255))
+    translucent = Image.new("RGBA", (2, 2), (200, 0, 0, 0))
+    translucent.putpixel((0, 0), (200, 0, 0, 255))
+
+    sheet = create_animation_sprite_sheet([opaque, translucent], background_color=(0, 0, 255, 255))
+
+    assert sheet.getpixel((0, 0)) == (10, 20, 30, 255)
+    assert sheet.getpixel((2, 0)) == (200, 0, 0, 255)
+    assert sheet.getpixel((3, 1)) == (0, 0, 255, 255)
+
+
 def test_apply_color_variant():
     """Test color variant application."""
     base_image = Image.new("RGBA", (32, 32), (255, 0, 0, 255))
@@ -75,6 +119,73 @@ def test_apply_color_variant():
     assert variant.mode == "RGBA"
 
 
+def test_apply_color_variant_preserves_alpha():
+    """Test that a variant keeps the source alpha and shifts the hue."""
+    base_image = Image.new("RGBA", (2, 1), (255, 0, 0, 255))
+    base_image.putpixel((1, 0), (255, 0, 0, 0))
+
+    variant = apply_color_variant(base_image, hue_shift=120, saturation_factor=1.0)
+
+    assert variant.getchannel("A").tobytes() == bytes([255, 0])
+    red, green, blue, _ = variant.getpixel((0, 0))
+    assert green > red and green > blue
+
+
+def test_apply_color_variant_keeps_identity_and_grays():
+    """Test that a zero shift is a no-op and grays stay gray."""
+    base_image = Image.new("RGBA", (2, 1), (200, 150, 50, 255))
+    base_image.putpixel((1, 0), (128, 128, 128, 255))
+
+    unchanged = apply_color_variant(base_image, hue_shift=0, saturation_factor=1.0)
+    shifted = apply_color_variant(base_image, hue_shift=60, saturation_factor=1.4)
+
+    assert unchanged.tobytes() == base_image.tobytes()
+    assert shifted.getpixel((1, 0)) == (128, 128, 128, 255)
+
+
+def test_to_palette_image_is_lossless():
+    """Test that palettizing keeps every pixel, including alpha."""
+    image = Image.new("RGBA", (4, 1), (0, 0, 0, 0))
+    image.putpixel((1, 0), (255, 0, 0, 255))
+    image.putpixel((2, 0), (0, 255, 0, 128))
+
+    palettized = to_palette_image(image)
+
+    assert palettized.mode == "P"
+    assert palettized.convert("RGBA").tobytes() == image.tobytes()
+
+
+def test_to_palette_image_never_merges_close_colors():
+    """Test that colors differing only in low bits are never merged."""
+    image = Image.new("RGBA", (2, 1), (100, 100, 100, 255))
+    image.putpixel((1, 0), (101, 100, 100, 255))
+
+    palettized = to_palette_image(image)
+
+    assert palettized.convert("RGBA").tobytes() == image.tobytes()
+
+
+def test_to_palette_image_keeps_ambiguous_alpha():
+    """Test that an RGB value with two alphas is left as RGBA."""
+    image = Image.new("RGBA", (2, 1), (255, 0, 0, 255))
+    image.putpixel((1, 0), (255, 0, 0, 0))
+
+    assert to_palette_image(image) is image
+
+
+def test_apply_color_variant_batch_matches_single():
+    """Test that batched variants match per-frame variants."""
+    frames = [Image.new("RGBA", (4, 4), color) for color in [(255, 0, 0, 255), (0, 0, 255, 128)]]
+    frames.append(frames[0].copy())
+
+    batched = apply_color_variant_batch(frames, hue_shift=60, saturation_factor=1.2)
+
+    assert len(batched) == len(frames)
+    for frame, variant in zip(frames, batched):
+        assert variant.tobytes() == apply_color_variant(frame, 60, 1.2).tobytes()
+    assert batched[0] is not batched[2]
+
+
 def test_upscale_nearest_neighbor():
     """Test pixel art upscaling."""
     image = Image.new("RGBA", (16, 16), (255, 0, 0, 255))
@@ -84,6 +195,19 @@ def test_upscale_nearest_neighbor():
     assert upscaled.size == (64, 64)
 
 
+def test_upscale_nearest_neighbor_repeats_pixels():
+    """Test that each source pixel becomes a solid scale x scale block."""
+    image = Image.new("RGBA", (2, 1), (255, 0, 0, 255))
+    image.putpixel((1, 0), (0, 0, 255, 128))
+
+    upscaled = upscale_nearest_neighbor(image, scale=3)
+
+    assert upscaled.size == (6, 3)
+    assert {upscaled.getpixel((x, y)) for x in range(3) for y in range(3)} == {(255, 0, 0, 255)}
+    assert {upscaled.getpixel((x, y)) for x in range(3, 6) for y in range(3)} == {(0, 0, 255, 128)}
+    assert upscale_nearest_neighbor(image, scale=1) is not image
+
+
 def test_create_grid_layout():
     """Test grid layout creation."""
     images = [
@@ -104,3 +228,15 @@ def test_create_grid_layout_empty():
     """Test that empty image list raises error."""
     with pytest.raises(ValueError):
         create_grid_layout([], cols=2)
+
+
+def test_save_frames_to_disk_deduplicates(tmp_path, test_frames):
+    """Test that identical frames are written once and shared."""
+    frames = [test_frames[0], test_frames[1], test_frames[0].copy()]
+
+    paths = save_frames_to_disk(frames, tmp_path, "creature_001", AnimationType.IDLE)
+
+    assert len(paths) == 3
+    assert all(path.exists() for path in paths)
+    assert paths[2].read_bytes() == paths[0].read_bytes()
+    assert Image.open(paths[1]).convert("RGBA").getpixel((0, 0)) == (0, 255, 0, 255)